@@ -14,8 +14,8 @@ Usage:
     python -m agent-test.cli dataset upload <suite_name> [--name="..."]
     python -m agent-test.cli dataset list
     
-    python -m agent-test.cli run <suite_name> [--agent=orchestrator|gapanalyzer] [--iterations=1]
-    python -m agent-test.cli run-all [--iterations=1]
+    python -m agent-test.cli run <suite_name> [--agent=orchestrator|gapanalyzer] [--iterations=1] [--concurrency=1]
+    python -m agent-test.cli run-all [--iterations=1] [--concurrency=1]
     
     python -m agent-test.cli results show <run_id>
     python -m agent-test.cli results list [--suite=<name>]
@@ -24,21 +24,14 @@ Usage:
 import click
 import json
 import sys
-from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
-# Add project root and current directory to path
-project_root = Path(__file__).parent.parent
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(current_dir))
-
-from core.suite_manager import SuiteManager
-from core.langfuse_integration import LangfuseManager
-from core.test_runner import TestRunner
-from core.results_manager import ResultsManager
-from schemas import AgentType, DifficultyLevel
+from .core.suite_manager import SuiteManager
+from .core.langfuse_integration import LangfuseManager
+from .core.test_runner import TestRunner, DEFAULT_CONCURRENCY
+from .core.results_manager import ResultsManager
+from .schemas import AgentType, DifficultyLevel
 
 @click.group()
 def cli():
@@ -235,7 +228,8 @@ def list():
 @click.option('--iterations', default=1, help='Número de iteraciones por pregunta')
 @click.option('--session-id', help='ID de sesión personalizada')
 @click.option('--run-name', help='Nombre personalizado para este run (aparece en Langfuse)')
-def run(suite_name: str, agent: str, iterations: int, session_id: str, run_name: str):
+@click.option('--concurrency', default=DEFAULT_CONCURRENCY, help='Máximo de ejecuciones de agentes en paralelo')
+def run(suite_name: str, agent: str, iterations: int, session_id: str, run_name: str, concurrency: int):
     """Ejecutar una suite de pruebas."""
     runner = TestRunner()
     
@@ -247,7 +241,8 @@ def run(suite_name: str, agent: str, iterations: int, session_id: str, run_name:
             agent_override=agent,
             iterations=iterations,
             session_id=session_id,
-            run_name=run_name
+            run_name=run_name,
+            concurrency=concurrency
         )
         
         click.echo(f"✅ Ejecución completada")
@@ -269,13 +264,16 @@ def run(suite_name: str, agent: str, iterations: int, session_id: str, run_name:
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        runner.close()
 
 @cli.command()
 @click.option('--iterations', default=1, help='Número de iteraciones por pregunta')
 @click.option('--agent-filter', type=click.Choice(['orchestrator', 'gapanalyzer']), 
               help='Filtrar por tipo de agente')
 @click.option('--run-name-prefix', help='Prefijo para nombres de runs (se agrega timestamp automáticamente)')
-def run_all(iterations: int, agent_filter: str, run_name_prefix: str):
+@click.option('--concurrency', default=DEFAULT_CONCURRENCY, help='Máximo de ejecuciones de agentes en paralelo')
+def run_all(iterations: int, agent_filter: str, run_name_prefix: str, concurrency: int):
     """Ejecutar todas las suites disponibles."""
     suite_manager = SuiteManager()
     runner = TestRunner()
@@ -306,7 +304,8 @@ def run_all(iterations: int, agent_filter: str, run_name_prefix: str):
             results = runner.run_suite(
                 suite_name=suite_info['name'],
                 iterations=iterations,
-                run_name=suite_run_name
+                run_name=suite_run_name,
+                concurrency=concurrency
             )
             
             all_results.append(results)
@@ -326,6 +325,8 @@ def run_all(iterations: int, agent_filter: str, run_name_prefix: str):
     except Exception as e:
         click.echo(f"❌ Error ejecutando suites: {e}")
         sys.exit(1)
+    finally:
+        runner.close()
 
 @cli.group()
 def results():
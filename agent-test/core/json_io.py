@@ -0,0 +1,76 @@
+"""
+JSON I/O - Lectura y escritura de archivos JSON del framework.
+
+Funciones compartidas por los gestores de suites y de resultados: usan
+orjson si está instalado y escriben los archivos de forma atómica.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files at least this large are memory-mapped for decoding
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def loads(data: bytes) -> Any:
+    """Parsear JSON desde bytes (orjson si está disponible)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializar un objeto como JSON indentado en UTF-8 (orjson si está disponible)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Escribir bytes en un archivo de forma atómica.
+    
+    Se escribe un archivo temporal en el mismo directorio y se reemplaza el
+    destino con os.replace, de modo que un corte a mitad de escritura nunca
+    deja un JSON truncado.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def dump_json(obj: Any, path: Path) -> None:
+    """Serializar un objeto como JSON indentado y escribirlo de forma atómica."""
+    write_atomic(path, dumps(obj))
+
+
+def load_json(path: Path) -> Any:
+    """
+    Cargar un archivo JSON (orjson si está disponible).
+    
+    Los archivos grandes se decodifican directamente desde un mapeo en
+    memoria, evitando copiar su contenido a un buffer intermedio.
+    """
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        data = f.read()
+    return loads(data)
@@ -6,15 +6,8 @@ de pruebas como traces en Langfuse.
 """
 
 import os
-import sys
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Any, Optional
-from uuid import uuid4
-
-# Add project root to path for tools import
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 try:
     from langfuse import Langfuse
@@ -24,9 +17,7 @@ except ImportError:
     LANGFUSE_AVAILABLE = False
     print("⚠️ Langfuse no disponible. Instala con: pip install langfuse")
 
-# Add parent directory to path for schemas import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from schemas import TestSuite, TestRun, ExecutionResult
+from ..schemas import TestSuite, TestRun, ExecutionResult
 
 class LangfuseManager:
     """Gestor de integración con Langfuse."""
@@ -462,6 +453,7 @@ class LangfuseManager:
                             print(f"      📊 {len([v for v in result.metrics.values() if isinstance(v, (int, float))])} métricas numéricas publicadas en Langfuse")
                         
                         run_traces.append(root_span.trace_id)
+                        result.langfuse_trace_id = root_span.trace_id
                         print(f"      📊 Dataset item completado (trace: {root_span.trace_id[:8]}...)")
                         
                 except Exception as e:
@@ -574,44 +566,6 @@ class LangfuseManager:
             traceback.print_exc()
             # Don't raise - this is enhancement, not critical
     
-    def create_trace_for_question(self, question_text: str, agent_response: str, 
-                                 metadata: Dict[str, Any]) -> str:
-        """
-        Crear un trace individual para una pregunta ejecutada.
-        
-        Args:
-            question_text: Texto de la pregunta
-            agent_response: Respuesta del agente
-            metadata: Metadata adicional
-            
-        Returns:
-            ID del trace creado
-        """
-        try:
-            # Create trace ID and start span for individual question
-            trace_id = self.client.create_trace_id(seed=f"question-{uuid4().hex[:8]}")
-            trace_context = {"trace_id": trace_id}
-            
-            span = self.client.start_span(
-                name=f"agent-question-{uuid4().hex[:8]}",
-                trace_context=trace_context,
-                input={"question": question_text},
-                output={"response": agent_response},
-                metadata=metadata
-            )
-            
-            # End the span immediately since this is a completed interaction
-            span.end()
-            
-            # Flush to ensure data is sent to Langfuse
-            self.client.flush()
-            
-            return trace_id
-            
-        except Exception as e:
-            print(f"❌ Error creando trace: {e}")
-            return ""
-    
     def get_run_results(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
         Obtener resultados de un run específico desde Langfuse.
@@ -6,22 +6,77 @@ y resultados de ejecución.
 """
 
 import re
-import sys
-from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-# Add parent directory to path for schemas import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from schemas import (
+from ..schemas import (
     TestQuestion, ExecutionResult, AgentType, 
     OrchestratorMetrics, GapAnalyzerMetrics
 )
 
+class SummaryAccumulator:
+    """
+    Acumulador incremental de métricas resumen de una ejecución.
+    
+    Permite incorporar cada ExecutionResult a medida que termina, sin
+    volver a recorrer la lista completa al final.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.successful = 0
+        self.total_execution_time = 0.0
+        self.total_response_length = 0
+        # metric -> [sum, count, max, min] over successful results
+        self._metrics: Dict[str, list] = {}
+    
+    def update(self, result: ExecutionResult) -> None:
+        """Incorporar un resultado al resumen."""
+        self.total += 1
+        self.total_execution_time += result.execution_time
+        
+        if not result.success:
+            return
+        
+        self.successful += 1
+        self.total_response_length += len(result.agent_response)
+        
+        for key, value in result.metrics.items():
+            if not isinstance(value, (int, float)):
+                continue
+            stats = self._metrics.get(key)
+            if stats is None:
+                self._metrics[key] = [value, 1, value, value]
+                continue
+            stats[0] += value
+            stats[1] += 1
+            if value > stats[2]:
+                stats[2] = value
+            if value < stats[3]:
+                stats[3] = value
+    
+    def finalize(self) -> Dict[str, Any]:
+        """Obtener las métricas resumen con el mismo formato que calculate_summary_metrics."""
+        if not self.total:
+            return {}
+        
+        summary = {
+            'total_questions': self.total,
+            'successful_questions': self.successful,
+            'success_rate': self.successful / self.total,
+            'average_execution_time': self.total_execution_time / self.total,
+            'total_execution_time': self.total_execution_time,
+            'average_response_length': self.total_response_length / max(self.successful, 1),
+        }
+        
+        for key, (total, count, maximum, minimum) in self._metrics.items():
+            summary[f'avg_{key}'] = total / count
+            summary[f'max_{key}'] = maximum
+            summary[f'min_{key}'] = minimum
+        
+        return summary
+
+
 class MetricsCollector:
     """Recolector de métricas de agentes."""
     
@@ -649,41 +704,10 @@ No agregues explicaciones, texto adicional ni formato. Solo el número."""
     
     def calculate_summary_metrics(self, results: List[ExecutionResult]) -> Dict[str, Any]:
         """Calcular métricas resumen para un conjunto de resultados."""
-        if not results:
-            return {}
-        
-        successful_results = [r for r in results if r.success]
-        
-        summary = {
-            'total_questions': len(results),
-            'successful_questions': len(successful_results),
-            'success_rate': len(successful_results) / len(results),
-            'average_execution_time': sum(r.execution_time for r in results) / len(results),
-            'total_execution_time': sum(r.execution_time for r in results),
-            'average_response_length': sum(len(r.agent_response) for r in successful_results) / max(len(successful_results), 1),
-        }
-        
-        # Aggregate metrics from successful results
-        if successful_results:
-            # Collect all metric keys
-            all_metric_keys = set()
-            for result in successful_results:
-                all_metric_keys.update(result.metrics.keys())
-            
-            # Calculate averages for numeric metrics
-            for key in all_metric_keys:
-                values = []
-                for result in successful_results:
-                    value = result.metrics.get(key)
-                    if isinstance(value, (int, float)):
-                        values.append(value)
-                
-                if values:
-                    summary[f'avg_{key}'] = sum(values) / len(values)
-                    summary[f'max_{key}'] = max(values)
-                    summary[f'min_{key}'] = min(values)
-        
-        return summary
+        accumulator = SummaryAccumulator()
+        for result in results:
+            accumulator.update(result)
+        return accumulator.finalize()
     
     def _init_orchestrator_patterns(self) -> Dict[str, List[str]]:
         """Inicializar patrones para métricas del Orchestrator."""
@@ -7,15 +7,78 @@ de suites de pruebas.
 
 import json
 import os
-import sys
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from uuid import uuid4
 
-# Add parent directory to path for schemas import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from schemas import TestRun, ExecutionResult
+from ..schemas import TestRun, ExecutionResult
+from .json_io import ORJSON_AVAILABLE, dump_json, dumps, load_json, write_atomic
+
+# Columns of the runs index, in table order
+RUN_INDEX_COLUMNS = (
+    'run_id', 'suite_name', 'agent_type', 'timestamp', 'timestamp_epoch',
+    'total_questions', 'successful_questions', 'success_rate', 'total_time',
+    'file_path'
+)
+
+RUN_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    suite_name TEXT NOT NULL,
+    agent_type TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    timestamp_epoch REAL NOT NULL,
+    total_questions INTEGER NOT NULL,
+    successful_questions INTEGER NOT NULL,
+    success_rate REAL NOT NULL,
+    total_time REAL NOT NULL,
+    file_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_suite_ts ON runs(suite_name, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_ts ON runs(timestamp DESC);
+CREATE TABLE IF NOT EXISTS suite_versions (
+    suite_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+BUMP_SUITE_VERSION = """
+INSERT INTO suite_versions (suite_name, version) VALUES (?, 1)
+ON CONFLICT(suite_name) DO UPDATE SET version = version + 1
+"""
+
+# Fixed columns of the CSV export (metric_* columns are appended per export)
+CSV_BASE_COLUMNS = (
+    'run_id', 'suite_name', 'agent_type', 'start_time', 'total_questions',
+    'successful_questions', 'total_time', 'question_id', 'question_text',
+    'question_success', 'question_execution_time', 'question_error',
+    'response_length'
+)
+
+# Metric value types exported to CSV
+CSV_METRIC_TYPES = (str, int, float, bool)
+
+# Pydantic-core serializer for runs, used when orjson is not installed
+_RUN_SERIALIZER = TestRun.__pydantic_serializer__
+
+
+def _dump_run(run_data: TestRun, path: Path) -> None:
+    """
+    Serializar una ejecución como JSON indentado.
+    
+    Sin orjson, la ejecución se serializa directamente con pydantic-core en
+    lugar de pasar por json.dumps, cuyo modo indentado no usa el encoder en C.
+    """
+    if ORJSON_AVAILABLE:
+        data = dumps(run_data.model_dump())
+    else:
+        data = _RUN_SERIALIZER.to_json(run_data, indent=2, fallback=str)
+    write_atomic(path, data)
+
 
 class ResultsManager:
     """Gestor de resultados de ejecuciones."""
@@ -39,6 +102,13 @@ class ResultsManager:
         (self.results_dir / "runs").mkdir(exist_ok=True)
         (self.results_dir / "summaries").mkdir(exist_ok=True)
         (self.results_dir / "exports").mkdir(exist_ok=True)
+        
+        # Runs index (SQLite, single long-lived connection)
+        index_path = self.results_dir / "runs_index.db"
+        is_new_index = not index_path.exists()
+        self._index_db = self._open_runs_index(index_path)
+        if is_new_index:
+            self._migrate_json_index()
     
     def save_run_results(self, run_data: TestRun) -> Path:
         """
@@ -55,18 +125,8 @@ class ResultsManager:
         filename = f"{timestamp}_{run_data.suite_name}_{run_data.run_id}.json"
         file_path = self.results_dir / "runs" / filename
         
-        # Convert to dict for JSON serialization
-        run_dict = run_data.model_dump()
-        
-        # Custom serialization for datetime objects
-        def serialize_datetime(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-        
-        # Save results
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(run_dict, f, indent=2, ensure_ascii=False, default=serialize_datetime)
+        # Save results (datetimes are serialized as ISO 8601)
+        _dump_run(run_data, file_path)
         
         # Update index
         self._update_runs_index(run_data, file_path)
@@ -87,25 +147,26 @@ class ResultsManager:
         Raises:
             ValueError: Si la ejecución no existe
         """
-        # Search for the run in the index
-        index = self._load_runs_index()
-        
-        run_info = None
-        for run in index.get('runs', []):
-            if run['run_id'] == run_id:
-                run_info = run
-                break
-        
-        if not run_info:
-            raise ValueError(f"Ejecución '{run_id}' no encontrada")
-        
         # Load the full results file
-        results_file = Path(run_info['file_path'])
-        if not results_file.exists():
-            raise ValueError(f"Archivo de resultados no encontrado: {results_file}")
+        return self._read_run_file(self._get_run_file(run_id))
+    
+    def get_run_results_light(self, run_id: str) -> Dict[str, Any]:
+        """
+        Obtener resultados de una ejecución sin los campos pesados.
         
-        with open(results_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        Igual que get_run_results, pero descarta 'agent_response' y 'metrics'
+        de cada resultado para agregaciones que solo usan estado y tiempos.
+        
+        Args:
+            run_id: ID de la ejecución
+            
+        Returns:
+            Datos de la ejecución sin respuestas ni métricas por pregunta
+            
+        Raises:
+            ValueError: Si la ejecución no existe
+        """
+        return self._read_run_file(self._get_run_file(run_id), light=True)
     
     def list_runs(self, suite_filter: Optional[str] = None, 
                   agent_filter: Optional[str] = None, 
@@ -121,20 +182,27 @@ class ResultsManager:
         Returns:
             Lista de información de ejecuciones
         """
-        index = self._load_runs_index()
-        runs = index.get('runs', [])
+        conditions = []
+        params: List[Any] = []
         
         # Apply filters
         if suite_filter:
-            runs = [r for r in runs if r['suite_name'] == suite_filter]
+            conditions.append("suite_name = ?")
+            params.append(suite_filter)
         
         if agent_filter:
-            runs = [r for r in runs if r['agent_type'] == agent_filter]
+            conditions.append("agent_type = ?")
+            params.append(agent_filter)
         
-        # Sort by timestamp (most recent first) and limit
-        runs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        query = "SELECT * FROM runs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         
-        return runs[:limit]
+        # Most recent first
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+        
+        return [dict(row) for row in self._index_db.execute(query, params)]
     
     def delete_run_results(self, run_id: str) -> bool:
         """
@@ -148,28 +216,21 @@ class ResultsManager:
         """
         try:
             # Find run in index
-            index = self._load_runs_index()
-            runs = index.get('runs', [])
-            
-            run_to_delete = None
-            for run in runs:
-                if run['run_id'] == run_id:
-                    run_to_delete = run
-                    break
+            row = self._index_db.execute(
+                "SELECT suite_name, file_path FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
             
-            if not run_to_delete:
+            if not row:
                 return False
             
             # Delete file
-            results_file = Path(run_to_delete['file_path'])
-            if results_file.exists():
-                results_file.unlink()
+            Path(row['file_path']).unlink(missing_ok=True)
             
             # Remove from index
-            index['runs'] = [r for r in runs if r['run_id'] != run_id]
-            index['updated_at'] = datetime.now().isoformat()
-            
-            self._save_runs_index(index)
+            with self._index_db:
+                self._index_db.execute("BEGIN")
+                self._index_db.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+                self._index_db.execute(BUMP_SUITE_VERSION, (row['suite_name'],))
             
             return True
             
@@ -177,17 +238,39 @@ class ResultsManager:
             print(f"❌ Error eliminando ejecución: {e}")
             return False
     
-    def generate_suite_summary(self, suite_name: str) -> Dict[str, Any]:
+    def generate_suite_summary(self, suite_name: str,
+                               include_question_perf: bool = True) -> Dict[str, Any]:
         """
         Generar resumen de todas las ejecuciones de una suite.
         
+        Las estadísticas globales se calculan solo a partir del índice; los
+        archivos de cada ejecución se leen únicamente para el detalle por
+        pregunta. El resumen guardado en summaries/ se reutiliza mientras no
+        se agreguen ni eliminen ejecuciones de la suite; los datos de validez
+        se guardan aparte (<suite>_summary.cache.json) y no forman parte del
+        resumen.
+        
         Args:
             suite_name: Nombre de la suite
+            include_question_perf: Si calcular performance por pregunta
             
         Returns:
             Resumen de ejecuciones de la suite
         """
-        # Get all runs for the suite
+        summary_file = self.results_dir / "summaries" / f"{suite_name}_summary.json"
+        cache_file = self.results_dir / "summaries" / f"{suite_name}_summary.cache.json"
+        index_version = self._get_suite_version(suite_name)
+        
+        # Reuse the stored summary if no run was added or removed since
+        try:
+            cache_info = load_json(cache_file)
+            if (cache_info.get('source_index_version') == index_version
+                    and (cache_info.get('includes_question_perf') or not include_question_perf)):
+                return load_json(summary_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        
+        # Get all runs for the suite (index entries only)
         runs = self.list_runs(suite_filter=suite_name, limit=100)
         
         if not runs:
@@ -197,23 +280,13 @@ class ResultsManager:
                 'error': 'No se encontraron ejecuciones para esta suite'
             }
         
-        # Load detailed results for analysis
-        detailed_results = []
-        for run_info in runs:
-            try:
-                run_data = self.get_run_results(run_info['run_id'])
-                detailed_results.append(run_data)
-            except Exception as e:
-                print(f"⚠️ Error cargando run {run_info['run_id']}: {e}")
-                continue
-        
-        # Calculate summary statistics
+        # Calculate summary statistics (runs come ordered most recent first)
         summary = {
             'suite_name': suite_name,
-            'total_runs': len(detailed_results),
+            'total_runs': len(runs),
             'date_range': {
-                'first_run': min(r['start_time'] for r in detailed_results),
-                'last_run': max(r['start_time'] for r in detailed_results)
+                'first_run': runs[-1]['timestamp'],
+                'last_run': runs[0]['timestamp']
             },
             'agent_types': {},
             'success_rates': [],
@@ -222,50 +295,52 @@ class ResultsManager:
             'trends': {}
         }
         
-        # Aggregate statistics
-        for run_data in detailed_results:
+        # Aggregate run-level statistics from the index
+        for run_info in runs:
             # Agent type distribution
-            agent_type = run_data['agent_type']
+            agent_type = run_info['agent_type']
             summary['agent_types'][agent_type] = summary['agent_types'].get(agent_type, 0) + 1
             
             # Success rates and times
-            success_rate = run_data['successful_questions'] / run_data['total_questions']
-            summary['success_rates'].append(success_rate)
-            summary['execution_times'].append(run_data['total_time'])
-            
-            # Question-level performance
-            for result in run_data.get('results', []):
-                question_id = result['question_id']
-                if question_id not in summary['question_performance']:
-                    summary['question_performance'][question_id] = {
-                        'attempts': 0,
-                        'successes': 0,
-                        'avg_time': 0,
-                        'times': []
-                    }
-                
-                perf = summary['question_performance'][question_id]
-                perf['attempts'] += 1
-                if result['success']:
-                    perf['successes'] += 1
-                perf['times'].append(result['execution_time'])
-        
-        # Calculate averages for question performance
-        for question_id in summary['question_performance']:
-            perf = summary['question_performance'][question_id]
-            perf['success_rate'] = perf['successes'] / perf['attempts']
-            perf['avg_time'] = sum(perf['times']) / len(perf['times'])
-            del perf['times']  # Remove raw times to save space
+            summary['success_rates'].append(run_info['success_rate'])
+            summary['execution_times'].append(run_info['total_time'])
         
         # Overall statistics
-        if summary['success_rates']:
-            summary['overall_success_rate'] = sum(summary['success_rates']) / len(summary['success_rates'])
-            summary['avg_execution_time'] = sum(summary['execution_times']) / len(summary['execution_times'])
-        
-        # Save summary
-        summary_file = self.results_dir / "summaries" / f"{suite_name}_summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+        summary['overall_success_rate'] = sum(summary['success_rates']) / len(summary['success_rates'])
+        summary['avg_execution_time'] = sum(summary['execution_times']) / len(summary['execution_times'])
+        
+        # Question-level performance requires the detailed results
+        if include_question_perf:
+            question_performance = defaultdict(
+                lambda: {'attempts': 0, 'successes': 0, 'sum_time': 0.0}
+            )
+            
+            run_ids = [run_info['run_id'] for run_info in runs]
+            for run_data in self._load_runs(run_ids, light=True):
+                for result in run_data.get('results', []):
+                    perf = question_performance[result['question_id']]
+                    perf['attempts'] += 1
+                    perf['successes'] += bool(result['success'])
+                    perf['sum_time'] += result['execution_time']
+            
+            # Calculate averages for question performance
+            for question_id, perf in question_performance.items():
+                sum_time = perf.pop('sum_time')
+                summary['question_performance'][question_id] = {
+                    'attempts': perf['attempts'],
+                    'successes': perf['successes'],
+                    'avg_time': sum_time / perf['attempts'],
+                    'success_rate': perf['successes'] / perf['attempts']
+                }
+        
+        # Save summary; the cache info is dropped first so a partial write
+        # never pairs a new summary with stale cache info
+        cache_file.unlink(missing_ok=True)
+        dump_json(summary, summary_file)
+        dump_json({
+            'source_index_version': index_version,
+            'includes_question_perf': include_question_perf
+        }, cache_file)
         
         return summary
     
@@ -284,14 +359,7 @@ class ResultsManager:
             raise ValueError(f"Formato no soportado: {format}")
         
         # Collect all results
-        export_data = []
-        for run_id in run_ids:
-            try:
-                run_data = self.get_run_results(run_id)
-                export_data.append(run_data)
-            except Exception as e:
-                print(f"⚠️ Error cargando run {run_id}: {e}")
-                continue
+        export_data = self._load_runs(run_ids)
         
         # Generate export filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -299,8 +367,7 @@ class ResultsManager:
         export_path = self.results_dir / "exports" / filename
         
         if format == "json":
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            dump_json(export_data, export_path)
         
         elif format == "csv":
             # Flatten results for CSV
@@ -320,22 +387,25 @@ class ResultsManager:
         Returns:
             Análisis de tendencias
         """
-        # Get recent runs
+        # Get recent runs (most recent first)
         runs = self.list_runs(suite_filter=suite_name, limit=100)
         
-        # Filter by date range
-        cutoff_date = datetime.now().timestamp() - (days * 24 * 60 * 60)
-        recent_runs = []
+        # Build data points from the index, oldest first
+        cutoff_date = datetime.now().timestamp() - days * 86400
+        trend_data = []
         
-        for run_info in runs:
-            try:
-                run_timestamp = datetime.fromisoformat(run_info['timestamp']).timestamp()
-                if run_timestamp >= cutoff_date:
-                    recent_runs.append(run_info)
-            except (ValueError, KeyError):
+        for run_info in reversed(runs):
+            if run_info['timestamp_epoch'] < cutoff_date or not run_info['total_questions']:
                 continue
-        
-        if not recent_runs:
+            
+            trend_data.append({
+                'timestamp': run_info['timestamp'],
+                'success_rate': run_info['success_rate'],
+                'avg_execution_time': run_info['total_time'] / run_info['total_questions'],
+                'total_time': run_info['total_time']
+            })
+        
+        if not trend_data:
             return {
                 'suite_name': suite_name,
                 'period_days': days,
@@ -343,23 +413,6 @@ class ResultsManager:
                 'error': 'No hay ejecuciones recientes en el período especificado'
             }
         
-        # Load detailed data
-        trend_data = []
-        for run_info in recent_runs:
-            try:
-                run_data = self.get_run_results(run_info['run_id'])
-                trend_data.append({
-                    'timestamp': run_data['start_time'],
-                    'success_rate': run_data['successful_questions'] / run_data['total_questions'],
-                    'avg_execution_time': run_data['total_time'] / run_data['total_questions'],
-                    'total_time': run_data['total_time']
-                })
-            except Exception:
-                continue
-        
-        # Sort by timestamp
-        trend_data.sort(key=lambda x: x['timestamp'])
-        
         # Calculate trends
         trends = {
             'suite_name': suite_name,
@@ -372,15 +425,75 @@ class ResultsManager:
         
         return trends
     
+    def _get_run_file(self, run_id: str) -> Path:
+        """Buscar en el índice el archivo de resultados de una ejecución."""
+        row = self._index_db.execute(
+            "SELECT file_path FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        
+        if not row:
+            raise ValueError(f"Ejecución '{run_id}' no encontrada")
+        
+        return Path(row['file_path'])
+    
+    def _read_run_file(self, results_file: Path, light: bool = False) -> Dict[str, Any]:
+        """
+        Leer un archivo de resultados.
+        
+        Con light=True se descartan 'agent_response' y 'metrics' de cada resultado.
+        """
+        try:
+            run_data = load_json(results_file)
+        except FileNotFoundError:
+            raise ValueError(f"Archivo de resultados no encontrado: {results_file}")
+        
+        if light:
+            for result in run_data.get('results', []):
+                result.pop('agent_response', None)
+                result.pop('metrics', None)
+        
+        return run_data
+    
+    def _load_runs(self, run_ids: List[str], light: bool = False) -> List[Dict[str, Any]]:
+        """
+        Cargar varias ejecuciones en paralelo, preservando el orden.
+        
+        Las rutas se resuelven en el hilo llamador (la conexión al índice no
+        se comparte entre hilos); solo la lectura de archivos es concurrente.
+        Las ejecuciones que no se pueden cargar se informan y se omiten.
+        """
+        run_files = []
+        for run_id in run_ids:
+            try:
+                run_files.append((run_id, self._get_run_file(run_id)))
+            except ValueError as e:
+                print(f"⚠️ Error cargando run {run_id}: {e}")
+        
+        def load(run_file: tuple) -> Optional[Dict[str, Any]]:
+            run_id, results_file = run_file
+            try:
+                return self._read_run_file(results_file, light=light)
+            except Exception as e:
+                print(f"⚠️ Error cargando run {run_id}: {e}")
+                return None
+        
+        if len(run_files) <= 1:
+            loaded = [load(run_file) for run_file in run_files]
+        else:
+            max_workers = min(16, (os.cpu_count() or 1) * 2, len(run_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(executor.map(load, run_files))
+        
+        return [run_data for run_data in loaded if run_data is not None]
+    
     def _update_runs_index(self, run_data: TestRun, file_path: Path) -> None:
         """Actualizar índice de ejecuciones."""
-        index = self._load_runs_index()
-        
         run_info = {
             'run_id': run_data.run_id,
             'suite_name': run_data.suite_name,
             'agent_type': run_data.agent_type.value,
             'timestamp': run_data.start_time.isoformat(),
+            'timestamp_epoch': run_data.start_time.timestamp(),
             'total_questions': run_data.total_questions,
             'successful_questions': run_data.successful_questions,
             'success_rate': run_data.get_success_rate(),
@@ -388,108 +501,137 @@ class ResultsManager:
             'file_path': str(file_path)
         }
         
-        # Add to index
-        if 'runs' not in index:
-            index['runs'] = []
-        
-        # Remove any existing entry with same run_id
-        index['runs'] = [r for r in index['runs'] if r['run_id'] != run_data.run_id]
-        index['runs'].append(run_info)
+        # Replaces any existing entry with same run_id
+        self._insert_runs([run_info])
+    
+    def _insert_runs(self, runs: List[Dict[str, Any]]) -> None:
+        """Insertar o reemplazar entradas en el índice de ejecuciones."""
+        placeholders = ", ".join(f":{column}" for column in RUN_INDEX_COLUMNS)
+        suite_names = {run['suite_name'] for run in runs}
+        with self._index_db:
+            self._index_db.execute("BEGIN")
+            self._index_db.executemany(
+                f"INSERT OR REPLACE INTO runs ({', '.join(RUN_INDEX_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                runs
+            )
+            # Invalidate stored summaries of the affected suites
+            self._index_db.executemany(
+                BUMP_SUITE_VERSION, [(name,) for name in suite_names]
+            )
+    
+    def _get_suite_version(self, suite_name: str) -> int:
+        """Obtener la versión del índice para una suite (cambia con cada alta o baja)."""
+        row = self._index_db.execute(
+            "SELECT version FROM suite_versions WHERE suite_name = ?", (suite_name,)
+        ).fetchone()
+        return row['version'] if row else 0
+    
+    def _open_runs_index(self, index_path: Path) -> sqlite3.Connection:
+        """Abrir (o crear) el índice SQLite de ejecuciones."""
+        conn = sqlite3.connect(index_path, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(RUN_INDEX_SCHEMA)
+        return conn
+    
+    def _migrate_json_index(self) -> None:
+        """Importar el índice JSON de versiones anteriores (runs_index.json) si existe."""
+        legacy_file = self.results_dir / "runs_index.json"
         
-        # Update metadata
-        index['updated_at'] = datetime.now().isoformat()
-        index['total_runs'] = len(index['runs'])
+        try:
+            legacy_index = load_json(legacy_file)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️ No se pudo migrar índice legado {legacy_file}: {e}")
+            return
         
-        self._save_runs_index(index)
-    
-    def _load_runs_index(self) -> Dict[str, Any]:
-        """Cargar índice de ejecuciones."""
-        index_file = self.results_dir / "runs_index.json"
+        runs = legacy_index.get('runs', [])
+        if isinstance(runs, dict):
+            runs = list(runs.values())
         
-        if not index_file.exists():
-            return {
-                'runs': [],
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat(),
-                'total_runs': 0
-            }
+        entries = []
+        for run in runs:
+            try:
+                run['timestamp_epoch'] = datetime.fromisoformat(run['timestamp']).timestamp()
+                entries.append({column: run[column] for column in RUN_INDEX_COLUMNS})
+            except (KeyError, ValueError):
+                continue
         
-        try:
-            with open(index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            # Return empty index if file is corrupted
-            return {
-                'runs': [],
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat(),
-                'total_runs': 0
-            }
+        if entries:
+            self._insert_runs(entries)
+            print(f"📥 {len(entries)} ejecuciones migradas desde {legacy_file}")
     
-    def _save_runs_index(self, index: Dict[str, Any]) -> None:
-        """Guardar índice de ejecuciones."""
-        index_file = self.results_dir / "runs_index.json"
-        
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False, default=str)
+    def close(self) -> None:
+        """Cerrar la conexión al índice de ejecuciones."""
+        self._index_db.close()
     
     def _export_to_csv(self, export_data: List[Dict[str, Any]], export_path: Path) -> None:
-        """Exportar datos a formato CSV."""
+        """Exportar datos a formato CSV, escribiendo fila por fila."""
         import csv
         
-        if not export_data:
+        # Discover metric columns (scalar values only) in a single pre-pass
+        metric_keys: Dict[str, None] = {}
+        has_rows = False
+        for run_data in export_data:
+            for result in run_data.get('results', []):
+                has_rows = True
+                for key, value in result.get('metrics', {}).items():
+                    if isinstance(value, CSV_METRIC_TYPES):
+                        metric_keys[key] = None
+        
+        if not has_rows:
             return
         
-        # Flatten data for CSV
-        flattened_data = []
+        metric_columns = list(metric_keys)
+        
+        # Write CSV
+        with open(export_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_BASE_COLUMNS + tuple(f'metric_{key}' for key in metric_columns))
+            writer.writerows(self._iter_csv_rows(export_data, metric_columns))
+    
+    def _iter_csv_rows(self, export_data: List[Dict[str, Any]],
+                       metric_columns: List[str]) -> Iterator[tuple]:
+        """Generar filas planas (una por pregunta) para exportación CSV."""
         for run_data in export_data:
-            base_info = {
-                'run_id': run_data['run_id'],
-                'suite_name': run_data['suite_name'],
-                'agent_type': run_data['agent_type'],
-                'start_time': run_data['start_time'],
-                'total_questions': run_data['total_questions'],
-                'successful_questions': run_data['successful_questions'],
-                'total_time': run_data['total_time']
-            }
+            run_values = (
+                run_data['run_id'],
+                run_data['suite_name'],
+                run_data['agent_type'],
+                run_data['start_time'],
+                run_data['total_questions'],
+                run_data['successful_questions'],
+                run_data['total_time'],
+            )
             
-            # Add question-level results
             for result in run_data.get('results', []):
-                row = base_info.copy()
-                row.update({
-                    'question_id': result['question_id'],
-                    'question_text': result['question_text'][:100] + '...' if len(result['question_text']) > 100 else result['question_text'],
-                    'question_success': result['success'],
-                    'question_execution_time': result['execution_time'],
-                    'question_error': result.get('error', ''),
-                    'response_length': len(result.get('agent_response', ''))
-                })
+                question_text = result['question_text']
+                metrics = result.get('metrics', {})
                 
-                # Add metrics
-                for key, value in result.get('metrics', {}).items():
-                    if isinstance(value, (str, int, float, bool)):
-                        row[f'metric_{key}'] = value
-                
-                flattened_data.append(row)
-        
-        # Write CSV
-        if flattened_data:
-            fieldnames = flattened_data[0].keys()
-            with open(export_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(flattened_data)
+                yield run_values + (
+                    result['question_id'],
+                    question_text[:100] + '...' if len(question_text) > 100 else question_text,
+                    result['success'],
+                    result['execution_time'],
+                    result.get('error', ''),
+                    len(result.get('agent_response', '')),
+                ) + tuple(
+                    value if isinstance(value := metrics.get(key), CSV_METRIC_TYPES) else ''
+                    for key in metric_columns
+                )
     
     def _calculate_trend(self, values: List[float]) -> Dict[str, Any]:
         """Calcular tendencia simple de una serie de valores."""
         if len(values) < 2:
             return {'trend': 'insufficient_data', 'slope': 0, 'direction': 'stable'}
         
-        # Simple linear regression
+        # Simple linear regression (closed form)
         n = len(values)
-        x_values = list(range(n))
+        x_values = range(n)
         
-        sum_x = sum(x_values)
+        sum_x = n * (n - 1) / 2
         sum_y = sum(values)
         sum_xy = sum(x * y for x, y in zip(x_values, values))
         sum_x2 = sum(x * x for x in x_values)
@@ -6,16 +6,46 @@ como archivos JSON en el filesystem.
 """
 
 import json
+import logging
 import os
-import sys
+import re
+import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 
-# Add parent directory to path for schemas import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from schemas import TestSuite, TestQuestion, AgentType, DifficultyLevel
+from ..schemas import TestSuite, TestQuestion, AgentType, DifficultyLevel
+from .json_io import dumps, loads, write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Default suites directory (agent-test/suites)
+DEFAULT_SUITES_DIR = Path(__file__).parent.parent / "suites"
+
+# Suite names: word characters and hyphens, with at least one alphanumeric
+SUITE_NAME_RE = re.compile(r'(?=[\w-]*[^\W_])[\w-]+')
+
+# Enum members by value, so per-question lookups skip Enum.__call__
+AGENT_TYPES = {member.value: member for member in AgentType}
+DIFFICULTY_LEVELS = {member.value: member for member in DifficultyLevel}
+
+# Suite fields that update_suite can patch without rebuilding the TestSuite
+METADATA_FIELDS = frozenset({'name', 'description', 'agent_type', 'version', 'author'})
+
+# pydantic-core serializer for suites; to_json returns UTF-8 bytes directly
+_SUITE_SERIALIZER = TestSuite.__pydantic_serializer__
+
+
+def _enum_member(members: Dict[str, Any], value: Any, enum_name: str) -> Any:
+    """Obtener el miembro de un enum por valor; ValueError si no existe (como Enum(value))."""
+    try:
+        return members[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {enum_name}") from None
+
 
 class SuiteManager:
     """Gestor de suites de pruebas."""
@@ -27,15 +57,19 @@ class SuiteManager:
         Args:
             suites_dir: Directorio donde almacenar las suites (default: agent-test/suites)
         """
-        if suites_dir is None:
-            # Get directory relative to this file
-            current_dir = Path(__file__).parent.parent
-            self.suites_dir = current_dir / "suites"
-        else:
-            self.suites_dir = Path(suites_dir)
+        self.suites_dir = DEFAULT_SUITES_DIR if suites_dir is None else Path(suites_dir)
         
         # Create directory if it doesn't exist
         self.suites_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Parsed suite files keyed by path, invalidated by (mtime_ns, size)
+        self._cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        
+        # list_suites entries keyed by path, valid while _cache holds the same parsed dict
+        self._info_cache: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        
+        # Last parsed dict per path that passed TestSuite validation
+        self._schema_valid: Dict[str, Dict[str, Any]] = {}
     
     def create_suite(self, name: str, agent_type: str, description: str = "") -> Path:
         """
@@ -53,7 +87,7 @@ class SuiteManager:
             ValueError: Si la suite ya existe o parámetros inválidos
         """
         # Validate name
-        if not name or not name.replace('_', '').replace('-', '').isalnum():
+        if not name or not SUITE_NAME_RE.fullmatch(name):
             raise ValueError("El nombre debe contener solo caracteres alfanuméricos, guiones y guiones bajos")
         
         # Check if suite already exists
@@ -63,18 +97,19 @@ class SuiteManager:
         
         # Validate agent type
         try:
-            agent_enum = AgentType(agent_type)
+            agent_enum = _enum_member(AGENT_TYPES, agent_type, 'AgentType')
         except ValueError:
             raise ValueError(f"Tipo de agente inválido: {agent_type}")
         
         # Create suite object
+        now = datetime.now()
         suite = TestSuite(
             name=name,
             description=description,
             agent_type=agent_enum,
             questions=[],
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
         
         # Save to file
@@ -93,40 +128,66 @@ class SuiteManager:
         Returns:
             ID de la pregunta creada
             
+        Raises:
+            ValueError: Si la suite no existe o datos inválidos
+        """
+        return self.add_questions(suite_name, [question_data])[0]
+    
+    def add_questions(self, suite_name: str, questions_data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Agregar varias preguntas a una suite con una sola lectura y escritura.
+        
+        Args:
+            suite_name: Nombre de la suite
+            questions_data: Lista con los datos de cada pregunta
+            
+        Returns:
+            IDs de las preguntas creadas, en el mismo orden
+            
         Raises:
             ValueError: Si la suite no existe o datos inválidos
         """
         # Load existing suite
-        suite = self.get_suite(suite_name)
-        
-        # Generate question ID
-        question_id = f"q_{uuid4().hex[:8]}"
-        
-        # Create question object
-        question = TestQuestion(
-            id=question_id,
-            question=question_data['question'],
-            expected_answer=question_data['expected_answer'],
-            context=question_data.get('context'),
-            subject=question_data.get('subject'),
-            difficulty=DifficultyLevel(question_data.get('difficulty', 'medium')),
-            metrics=question_data.get('metrics', {}),
-            practice_id=question_data.get('practice_id'),
-            exercise_section=question_data.get('exercise_section'),
-            tags=question_data.get('tags', []),
-            created_at=datetime.now(),
-            updated_at=datetime.now()
-        )
+        suite_obj = self._load_model(suite_name)
         
-        # Add to suite
-        suite_obj = TestSuite(**suite)
-        suite_obj.questions.append(question)
-        suite_obj.updated_at = datetime.now()
+        now = datetime.now()
+        question_ids = []
+        
+        for question_data in questions_data:
+            # Generate question ID
+            question_id = f"q_{uuid4().hex[:8]}"
+            
+            # Create question object
+            question = TestQuestion(
+                id=question_id,
+                question=question_data['question'],
+                expected_answer=question_data['expected_answer'],
+                context=question_data.get('context'),
+                subject=question_data.get('subject'),
+                difficulty=_enum_member(
+                    DIFFICULTY_LEVELS, question_data.get('difficulty', 'medium'), 'DifficultyLevel'
+                ),
+                metrics=question_data.get('metrics', {}),
+                practice_id=question_data.get('practice_id'),
+                exercise_section=question_data.get('exercise_section'),
+                tags=question_data.get('tags', []),
+                created_at=now,
+                updated_at=now
+            )
+            
+            # Add to suite
+            suite_obj.questions.append(question)
+            question_ids.append(question_id)
+        
+        if not question_ids:
+            return question_ids
+        
+        suite_obj.updated_at = now
         
         # Save updated suite
         self._save_suite(suite_obj)
         
-        return question_id
+        return question_ids
     
     def get_suite(self, name: str) -> Dict[str, Any]:
         """
@@ -136,28 +197,12 @@ class SuiteManager:
             name: Nombre de la suite (puede ser el nombre interno o el nombre del archivo)
             
         Returns:
-            Datos de la suite como diccionario
+            Datos de la suite como diccionario (compartido con el caché, no modificar)
             
         Raises:
             ValueError: Si la suite no existe
         """
-        # First try with direct filename
-        suite_file = self.suites_dir / f"{name}.json"
-        if suite_file.exists():
-            with open(suite_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        # If not found, search by internal name in all JSON files
-        for suite_file in self.suites_dir.glob("*.json"):
-            try:
-                with open(suite_file, 'r', encoding='utf-8') as f:
-                    suite_data = json.load(f)
-                    if suite_data.get('name') == name:
-                        return suite_data
-            except (json.JSONDecodeError, KeyError):
-                continue
-        
-        raise ValueError(f"La suite '{name}' no existe")
+        return self._load_raw(self._find_suite_file(name))
     
     def list_suites(self) -> List[Dict[str, Any]]:
         """
@@ -168,25 +213,33 @@ class SuiteManager:
         """
         suites = []
         
-        for suite_file in self.suites_dir.glob("*.json"):
+        suite_files = self._suite_files()
+        self._prefetch(suite_files)
+        
+        for suite_file in suite_files:
             try:
-                with open(suite_file, 'r', encoding='utf-8') as f:
-                    suite_data = json.load(f)
+                suite_data = self._load_raw(suite_file)
                 
-                suite_info = {
-                    'name': suite_data['name'],
-                    'description': suite_data.get('description', ''),
-                    'agent_type': suite_data['agent_type'],
-                    'question_count': len(suite_data.get('questions', [])),
-                    'created': suite_data.get('created_at', ''),
-                    'modified': suite_data.get('updated_at', ''),
-                    'file_path': str(suite_file)
-                }
+                key = str(suite_file)
+                cached = self._info_cache.get(key)
+                if cached is not None and cached[0] is suite_data:
+                    suite_info = cached[1]
+                else:
+                    suite_info = {
+                        'name': suite_data['name'],
+                        'description': suite_data.get('description', ''),
+                        'agent_type': suite_data['agent_type'],
+                        'question_count': len(suite_data.get('questions', [])),
+                        'created': suite_data.get('created_at', ''),
+                        'modified': suite_data.get('updated_at', ''),
+                        'file_path': key
+                    }
+                    self._info_cache[key] = (suite_data, suite_info)
                 
-                suites.append(suite_info)
+                suites.append(dict(suite_info))
                 
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"⚠️ Error leyendo suite {suite_file}: {e}")
+            except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
+                logger.warning("Error leyendo suite %s: %s", suite_file, e)
                 continue
         
         # Sort by modification date (most recent first)
@@ -205,9 +258,21 @@ class SuiteManager:
         Raises:
             ValueError: Si la suite no existe
         """
+        # Metadata-only updates patch the parsed file and leave questions untouched
+        if updates.keys() <= METADATA_FIELDS and all(isinstance(v, str) for v in updates.values()):
+            suite_data = dict(self._load_raw(self._find_suite_file(name)))
+            suite_data.update(updates)
+            if 'agent_type' in updates:
+                suite_data['agent_type'] = _enum_member(AGENT_TYPES, updates['agent_type'], 'AgentType').value
+            suite_data['updated_at'] = datetime.now().isoformat()
+            
+            suite_file = self.suites_dir / f"{suite_data['name']}.json"
+            write_atomic(suite_file, dumps(suite_data))
+            self._cache.pop(str(suite_file), None)
+            return
+        
         # Load existing suite
-        suite_data = self.get_suite(name)
-        suite = TestSuite(**suite_data)
+        suite = self._load_model(name)
         
         # Apply updates
         for field, value in updates.items():
@@ -230,6 +295,9 @@ class SuiteManager:
             True si se eliminó exitosamente
         """
         suite_file = self.suites_dir / f"{name}.json"
+        self._cache.pop(str(suite_file), None)
+        self._info_cache.pop(str(suite_file), None)
+        self._schema_valid.pop(str(suite_file), None)
         if suite_file.exists():
             suite_file.unlink()
             return True
@@ -247,24 +315,21 @@ class SuiteManager:
         Raises:
             ValueError: Si la suite o pregunta no existe
         """
-        suite_data = self.get_suite(suite_name)
-        suite = TestSuite(**suite_data)
+        suite = self._load_model(suite_name)
         
         # Find and update question
-        question_found = False
-        for question in suite.questions:
-            if question.id == question_id:
-                for field, value in updates.items():
-                    if hasattr(question, field):
-                        setattr(question, field, value)
-                question.updated_at = datetime.now()
-                question_found = True
-                break
-        
-        if not question_found:
+        idx = self._index_questions(suite).get(question_id)
+        if idx is None:
             raise ValueError(f"Pregunta '{question_id}' no encontrada en suite '{suite_name}'")
         
-        suite.updated_at = datetime.now()
+        question = suite.questions[idx]
+        for field, value in updates.items():
+            if hasattr(question, field):
+                setattr(question, field, value)
+        
+        now = datetime.now()
+        question.updated_at = now
+        suite.updated_at = now
         self._save_suite(suite)
     
     def remove_question(self, suite_name: str, question_id: str) -> bool:
@@ -278,8 +343,7 @@ class SuiteManager:
         Returns:
             True si se eliminó exitosamente
         """
-        suite_data = self.get_suite(suite_name)
-        suite = TestSuite(**suite_data)
+        suite = self._load_model(suite_name)
         
         # Find and remove question
         original_count = len(suite.questions)
@@ -309,27 +373,20 @@ class SuiteManager:
         if not file_path.exists():
             raise ValueError(f"Archivo no encontrado: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            suite_data = json.load(f)
-        
         # Validate suite data
         try:
-            suite = TestSuite(**suite_data)
+            suite = TestSuite.model_validate_json(file_path.read_bytes())
         except Exception as e:
             raise ValueError(f"Formato de suite inválido: {e}")
         
         # Check if suite already exists
-        existing_file = self.suites_dir / f"{suite.name}.json"
-        if existing_file.exists():
-            # Generate unique name
+        existing_names = {suite_file.stem for suite_file in self._suite_files()}
+        if suite.name in existing_names:
+            # Generate unique name (lowest free counter)
             counter = 1
-            while True:
-                new_name = f"{suite.name}_imported_{counter}"
-                new_file = self.suites_dir / f"{new_name}.json"
-                if not new_file.exists():
-                    suite.name = new_name
-                    break
+            while f"{suite.name}_imported_{counter}" in existing_names:
                 counter += 1
+            suite.name = f"{suite.name}_imported_{counter}"
         
         # Save imported suite
         self._save_suite(suite)
@@ -344,13 +401,16 @@ class SuiteManager:
             name: Nombre de la suite
             output_path: Path donde guardar el archivo
         """
-        suite_data = self.get_suite(name)
+        suite_file = self._find_suite_file(name)
         
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(suite_data, f, indent=2, ensure_ascii=False, default=str)
+        # Stored suites are already indented UTF-8 JSON; copy the bytes as-is
+        try:
+            shutil.copyfile(suite_file, output_path)
+        except shutil.SameFileError:
+            pass
     
     def validate_suite(self, name: str) -> Dict[str, Any]:
         """
@@ -363,40 +423,57 @@ class SuiteManager:
             Diccionario con resultado de validación
         """
         try:
-            suite_data = self.get_suite(name)
-            suite = TestSuite(**suite_data)
+            suite_file = self._find_suite_file(name)
+            suite_data = self._load_raw(suite_file)
+            
+            # Schema check only when this version of the file was not validated yet
+            key = str(suite_file)
+            if self._schema_valid.get(key) is not suite_data:
+                TestSuite.model_validate(suite_data)
+                self._schema_valid[key] = suite_data
+            
+            questions = suite_data['questions']
             
             validation_result = {
                 'valid': True,
                 'errors': [],
                 'warnings': [],
                 'summary': {
-                    'name': suite.name,
-                    'agent_type': suite.agent_type,
-                    'question_count': len(suite.questions),
-                    'subjects': list(set(q.subject for q in suite.questions if q.subject))
+                    'name': suite_data['name'],
+                    'agent_type': _enum_member(AGENT_TYPES, suite_data['agent_type'], 'AgentType'),
+                    'question_count': len(questions),
+                    'subjects': []
                 }
             }
             
             # Validate questions
-            if not suite.questions:
+            if not questions:
                 validation_result['warnings'].append("Suite no tiene preguntas")
             
             question_ids = set()
-            for question in suite.questions:
+            subjects = {}
+            for question in questions:
+                question_id = question['id']
+                
+                # Collect distinct subjects, in order of first appearance
+                if question.get('subject'):
+                    subjects[question['subject']] = None
+                
                 # Check for duplicate IDs
-                if question.id in question_ids:
-                    validation_result['errors'].append(f"ID de pregunta duplicado: {question.id}")
+                if question_id in question_ids:
+                    validation_result['errors'].append(f"ID de pregunta duplicado: {question_id}")
                     validation_result['valid'] = False
-                question_ids.add(question.id)
+                question_ids.add(question_id)
                 
                 # Check for empty questions
-                if not question.question.strip():
-                    validation_result['errors'].append(f"Pregunta vacía: {question.id}")
+                if not question['question'].strip():
+                    validation_result['errors'].append(f"Pregunta vacía: {question_id}")
                     validation_result['valid'] = False
                 
-                if not question.expected_answer.strip():
-                    validation_result['warnings'].append(f"Respuesta esperada vacía: {question.id}")
+                if not question['expected_answer'].strip():
+                    validation_result['warnings'].append(f"Respuesta esperada vacía: {question_id}")
+            
+            validation_result['summary']['subjects'] = list(subjects)
             
             return validation_result
             
@@ -417,17 +494,142 @@ class SuiteManager:
         """
         suite_file = self.suites_dir / f"{suite.name}.json"
         
-        # Convert to dict for JSON serialization
-        suite_dict = suite.model_dump()
+        write_atomic(suite_file, _SUITE_SERIALIZER.to_json(suite, indent=2))
+        
+        self._cache.pop(str(suite_file), None)
+    
+    @staticmethod
+    def _index_questions(suite: TestSuite) -> Dict[str, int]:
+        """
+        Construir un índice id → posición de las preguntas de una suite.
+        
+        Si un id está duplicado, se conserva la primera aparición.
+        """
+        index: Dict[str, int] = {}
+        for i, question in enumerate(suite.questions):
+            index.setdefault(question.id, i)
+        return index
+    
+    def _find_suite_file(self, name: str) -> Path:
+        """
+        Resolver el archivo de una suite por nombre de archivo o nombre interno.
+        
+        Args:
+            name: Nombre de la suite
+            
+        Returns:
+            Path al archivo JSON de la suite
+            
+        Raises:
+            ValueError: Si la suite no existe
+        """
+        # First try with direct filename
+        suite_file = self.suites_dir / f"{name}.json"
+        if suite_file.is_file():
+            return suite_file
+        
+        # If not found, search by internal name in all JSON files
+        suite_files = self._suite_files()
+        self._prefetch(suite_files)
+        for suite_file in suite_files:
+            try:
+                if self._load_raw(suite_file).get('name') == name:
+                    return suite_file
+            except (json.JSONDecodeError, KeyError, FileNotFoundError):
+                continue
         
-        # Custom serialization for datetime objects
-        def serialize_datetime(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        raise ValueError(f"La suite '{name}' no existe")
+    
+    def _load_model(self, name: str) -> TestSuite:
+        """
+        Cargar una suite como TestSuite validando el JSON directamente.
         
-        with open(suite_file, 'w', encoding='utf-8') as f:
-            json.dump(suite_dict, f, indent=2, ensure_ascii=False, default=serialize_datetime)
+        Args:
+            name: Nombre de la suite
+            
+        Returns:
+            Objeto TestSuite nuevo, seguro de modificar
+            
+        Raises:
+            ValueError: Si la suite no existe
+        """
+        return TestSuite.model_validate_json(self._find_suite_file(name).read_bytes())
+    
+    def _suite_files(self) -> List[Path]:
+        """Listar los archivos JSON del directorio de suites con una sola pasada de scandir."""
+        with os.scandir(self.suites_dir) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
+    
+    def _prefetch(self, suite_files: List[Path]) -> None:
+        """
+        Cargar en el caché, en paralelo, los archivos que cambiaron desde la última lectura.
+        
+        Solo la lectura de bytes es concurrente; el parseo y la escritura del
+        caché ocurren en el hilo llamador. Los archivos ilegibles o inválidos
+        se omiten aquí y los reporta quien los lea después con _load_raw.
+        """
+        stale = []
+        for suite_file in suite_files:
+            try:
+                st = suite_file.stat()
+            except FileNotFoundError:
+                continue
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(str(suite_file))
+            if cached is None or cached[0] != signature:
+                stale.append((suite_file, signature))
+        
+        if len(stale) <= 1:
+            return
+        
+        def read(suite_file: Path) -> Optional[bytes]:
+            try:
+                return suite_file.read_bytes()
+            except OSError:
+                return None
+        
+        max_workers = min(16, (os.cpu_count() or 1) * 2, len(stale))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = list(executor.map(read, [suite_file for suite_file, _ in stale]))
+        
+        # A file rewritten mid-read is cached under its older signature,
+        # so the next _load_raw sees a mismatch and reads it again
+        for (suite_file, signature), raw in zip(stale, contents):
+            if raw is None:
+                continue
+            try:
+                self._cache[str(suite_file)] = (signature, loads(raw))
+            except ValueError:
+                continue
+    
+    def _load_raw(self, suite_file: Path) -> Dict[str, Any]:
+        """
+        Leer y parsear un archivo de suite, reutilizando el caché si no cambió.
+        
+        Args:
+            suite_file: Path al archivo JSON de la suite
+            
+        Returns:
+            Datos de la suite como diccionario
+            
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            json.JSONDecodeError: Si el archivo no es JSON válido
+        """
+        st = suite_file.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        key = str(suite_file)
+        
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        data = loads(suite_file.read_bytes())
+        self._cache[key] = (signature, data)
+        return data
     
     def get_suite_stats(self) -> Dict[str, Any]:
         """
@@ -438,42 +640,26 @@ class SuiteManager:
         """
         suites = self.list_suites()
         
-        if not suites:
-            return {
-                'total_suites': 0,
-                'total_questions': 0,
-                'agent_types': {},
-                'subjects': {},
-                'difficulty_levels': {}
-            }
-        
-        stats = {
-            'total_suites': len(suites),
-            'total_questions': sum(s['question_count'] for s in suites),
-            'agent_types': {},
-            'subjects': {},
-            'difficulty_levels': {}
-        }
+        agent_types = Counter()
+        subjects = Counter()
+        difficulty_levels = Counter()
         
-        # Count by agent type
-        for suite_info in suites:
-            agent_type = suite_info['agent_type']
-            stats['agent_types'][agent_type] = stats['agent_types'].get(agent_type, 0) + 1
-        
-        # Detailed analysis requires loading each suite
+        # Single pass; list_suites just parsed every file, so _load_raw hits the cache
         for suite_info in suites:
+            agent_types[suite_info['agent_type']] += 1
             try:
-                suite_data = self.get_suite(suite_info['name'])
-                
-                # Count subjects and difficulty levels
-                for question in suite_data.get('questions', []):
-                    subject = question.get('subject', 'Sin materia')
-                    difficulty = question.get('difficulty', 'medium')
-                    
-                    stats['subjects'][subject] = stats['subjects'].get(subject, 0) + 1
-                    stats['difficulty_levels'][difficulty] = stats['difficulty_levels'].get(difficulty, 0) + 1
-                    
+                questions = self._load_raw(Path(suite_info['file_path'])).get('questions', [])
             except Exception:
                 continue
+            
+            # Count subjects and difficulty levels
+            subjects.update(q.get('subject', 'Sin materia') for q in questions)
+            difficulty_levels.update(q.get('difficulty', 'medium') for q in questions)
         
-        return stats
\ No newline at end of file
+        return {
+            'total_suites': len(suites),
+            'total_questions': sum(s['question_count'] for s in suites),
+            'agent_types': dict(agent_types),
+            'subjects': dict(subjects),
+            'difficulty_levels': dict(difficulty_levels)
+        }
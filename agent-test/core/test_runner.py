@@ -6,30 +6,28 @@ recolecta métricas y genera reportes de resultados.
 """
 
 import asyncio
-import sys
+import os
+import secrets
 import time
+import traceback
+from collections import defaultdict
+from contextlib import aclosing
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Any, Optional, AsyncGenerator
-from uuid import uuid4
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple
 
 from orchestrator.agent_executor import OrchestratorAgentExecutor
 from gapanalyzer.agent_executor import GapAnalyzerAgentExecutor
 
-# Add agent-test directory to path for schemas import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from schemas import TestSuite, TestRun, ExecutionResult, AgentType, OrchestratorMetrics, GapAnalyzerMetrics
+from ..schemas import TestSuite, TestRun, ExecutionResult, AgentType, OrchestratorMetrics, GapAnalyzerMetrics
+from .suite_manager import SuiteManager
+from .results_manager import ResultsManager
+from .metrics_collector import MetricsCollector, SummaryAccumulator
+from .langfuse_integration import LangfuseManager, check_langfuse_availability
 
-# Import from current directory
-sys.path.insert(0, str(Path(__file__).parent))
-from suite_manager import SuiteManager
-from results_manager import ResultsManager
-from metrics_collector import MetricsCollector
-from langfuse_integration import LangfuseManager, check_langfuse_availability
+# Agent requests in flight at once during a suite run. Serial by default:
+# with more than one, execution_time includes contention with the other
+# in-flight questions and is not comparable with serial runs
+DEFAULT_CONCURRENCY = 1
 
 class TestRunner:
     """Ejecutor de suites de pruebas."""
@@ -40,9 +38,16 @@ class TestRunner:
         self.results_manager = ResultsManager()
         self.metrics_collector = MetricsCollector()
         
-        # Initialize agents
-        self.orchestrator = OrchestratorAgentExecutor()
-        self.gapanalyzer = GapAnalyzerAgentExecutor()
+        # Validated suites by name, valid while the suite manager returns the same parsed dict
+        self._suite_cache: Dict[str, Tuple[Dict[str, Any], TestSuite]] = {}
+        
+        # Agents are created on first use (see the orchestrator/gapanalyzer properties)
+        self._orchestrator: Optional[OrchestratorAgentExecutor] = None
+        self._gapanalyzer: Optional[GapAnalyzerAgentExecutor] = None
+        
+        # One event loop for every suite run by this instance, so the agents'
+        # async clients keep their connection pools between suites (created on first run)
+        self._runner: Optional[asyncio.Runner] = None
         
         # Initialize Langfuse if available
         self.langfuse_enabled = check_langfuse_availability()
@@ -58,7 +63,8 @@ class TestRunner:
     
     def run_suite(self, suite_name: str, agent_override: Optional[str] = None, 
                   iterations: int = 1, session_id: Optional[str] = None,
-                  run_name: Optional[str] = None) -> Dict[str, Any]:
+                  run_name: Optional[str] = None,
+                  concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Any]:
         """
         Ejecutar una suite de pruebas.
         
@@ -68,48 +74,50 @@ class TestRunner:
             iterations: Número de iteraciones por pregunta
             session_id: ID de sesión personalizada
             run_name: Nombre personalizado para el run (aparece en Langfuse)
+            concurrency: Máximo de ejecuciones de agentes en paralelo
             
         Returns:
             Resultados de la ejecución
         """
         # Load suite
-        suite_data = self.suite_manager.get_suite(suite_name)
-        suite = TestSuite(**suite_data)
+        suite = self._load_suite(suite_name)
         
         # Determine agent type
         agent_type = AgentType(agent_override) if agent_override else suite.agent_type
         
         # Generate run ID and session if not provided
-        run_id = f"run_{uuid4().hex[:12]}"
+        run_id = f"run_{secrets.token_hex(6)}"
         if not session_id:
-            session_id = f"test_session_{uuid4().hex[:8]}"
+            session_id = f"test_session_{secrets.token_hex(4)}"
         
         print(f"🚀 Ejecutando suite '{suite_name}'")
         print(f"   Agente: {agent_type.value}")
         print(f"   Preguntas: {len(suite.questions)}")
         print(f"   Iteraciones: {iterations}")
+        print(f"   Concurrencia: {concurrency}")
         print(f"   Run ID: {run_id}")
         print(f"   Session ID: {session_id}")
         
-        # Initialize run data
+        # Initialize run data (wall-clock stamps for the record, monotonic clock for durations)
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         results = []
         
         try:
-            # Execute questions
-            if agent_type == AgentType.BOTH:
-                # Execute with both agents
-                results = self._run_with_both_agents(suite, iterations, session_id)
-            else:
-                # Execute with single agent
-                results = self._run_with_single_agent(suite, agent_type, iterations, session_id)
+            # Execute questions on a single event loop
+            summary = SummaryAccumulator()
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+            results = self._runner.run(self._run_questions(
+                suite, agent_type, iterations, session_id, concurrency, summary
+            ))
             
             end_time = datetime.now()
-            total_time = (end_time - start_time).total_seconds()
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Calculate summary metrics
             successful_questions = sum(1 for r in results if r.success)
-            summary_metrics = self.metrics_collector.calculate_summary_metrics(results)
+            summary_metrics = summary.finalize()
             
             # Create run data
             run_data = TestRun(
@@ -127,9 +135,6 @@ class TestRunner:
                 summary_metrics=summary_metrics
             )
             
-            # Save results locally
-            results_file = self.results_manager.save_run_results(run_data)
-            
             # Upload to Langfuse if enabled
             langfuse_run_info = None
             if self.langfuse_enabled:
@@ -152,6 +157,9 @@ class TestRunner:
                 except Exception as e:
                     print(f"⚠️ Error subiendo a Langfuse: {e}")
             
+            # Save results locally (after the upload, so the Langfuse ids are included)
+            results_file = self.results_manager.save_run_results(run_data)
+            
             print(f"✅ Suite ejecutada exitosamente")
             print(f"   Tiempo total: {total_time:.2f}s")
             print(f"   Éxito: {successful_questions}/{len(results)} ({run_data.get_success_rate():.1%})")
@@ -172,13 +180,72 @@ class TestRunner:
             
         except Exception as e:
             print(f"❌ Error ejecutando suite: {e}")
-            import traceback
-            traceback.print_exc()
+            # The exception is re-raised; only dump the stack here when debugging
+            if os.getenv('TEST_RUNNER_DEBUG', '').lower() in ('true', '1', 'yes', 'on'):
+                traceback.print_exc()
             raise
     
+    @property
+    def orchestrator(self) -> OrchestratorAgentExecutor:
+        """Executor del Orchestrator, creado la primera vez que se usa."""
+        if self._orchestrator is None:
+            self._orchestrator = OrchestratorAgentExecutor()
+        return self._orchestrator
+    
+    @property
+    def gapanalyzer(self) -> GapAnalyzerAgentExecutor:
+        """Executor del GapAnalyzer, creado la primera vez que se usa."""
+        if self._gapanalyzer is None:
+            self._gapanalyzer = GapAnalyzerAgentExecutor()
+        return self._gapanalyzer
+    
+    def _load_suite(self, suite_name: str) -> TestSuite:
+        """
+        Obtener una suite validada, reutilizando la validación si el archivo no cambió.
+        
+        El TestSuite devuelto es compartido entre llamadas y no debe modificarse.
+        """
+        suite_data = self.suite_manager.get_suite(suite_name)
+        
+        cached = self._suite_cache.get(suite_name)
+        if cached is not None and cached[0] is suite_data:
+            return cached[1]
+        
+        suite = TestSuite(**suite_data)
+        self._suite_cache[suite_name] = (suite_data, suite)
+        return suite
+    
+    def close(self) -> None:
+        """Cerrar el event loop de ejecución y el índice de resultados."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+        self.results_manager.close()
+    
+    def __enter__(self) -> "TestRunner":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.close()
+    
+    @staticmethod
+    def _educational_context(question) -> Dict[str, Any]:
+        """Campos de contexto educativo de una pregunta que se copian a cada ExecutionResult."""
+        return {
+            'subject': question.subject,
+            'difficulty': question.difficulty.value if hasattr(question.difficulty, 'value') else str(question.difficulty),
+            'practice_id': question.practice_id,
+            'exercise_section': question.exercise_section,
+            'tags': question.tags
+        }
+    
     def _create_error_result(self, question, question_id: str, error: str, 
-                           session_id: str, execution_time: float = 0.0) -> ExecutionResult:
+                           session_id: str, execution_time: float = 0.0,
+                           educational_context: Optional[Dict[str, Any]] = None) -> ExecutionResult:
         """Helper para crear ExecutionResult con error incluyendo contexto educativo."""
+        if educational_context is None:
+            educational_context = self._educational_context(question)
+        
         return ExecutionResult(
             question_id=question_id,
             question_text=question.question,
@@ -188,103 +255,143 @@ class TestRunner:
             session_id=session_id,
             
             # Educational context from original question
-            subject=question.subject,
-            difficulty=question.difficulty.value if hasattr(question.difficulty, 'value') else str(question.difficulty),
-            practice_id=question.practice_id,
-            exercise_section=question.exercise_section,
-            tags=question.tags
+            **educational_context
         )
     
-    def _run_with_single_agent(self, suite: TestSuite, agent_type: AgentType, 
-                              iterations: int, session_id: str) -> List[ExecutionResult]:
-        """Ejecutar suite con un solo agente."""
-        results = []
+    async def _run_questions(self, suite: TestSuite, agent_type: AgentType, iterations: int,
+                             session_id: str, concurrency: int,
+                             summary: SummaryAccumulator) -> List[ExecutionResult]:
+        """Ejecutar todas las preguntas de la suite con concurrencia acotada."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
         
-        for i, question in enumerate(suite.questions):
-            print(f"📝 Pregunta {i+1}/{len(suite.questions)}: {question.question[:80]}...")
+        if agent_type == AgentType.BOTH:
+            # Execute with both agents
+            return await self._run_with_both_agents(suite, iterations, session_id, semaphore, summary)
+        
+        # Execute with single agent
+        return await self._run_with_single_agent(suite, agent_type, iterations, session_id, semaphore, summary)
+    
+    async def _collect_results(self, tasks: List, summary: SummaryAccumulator,
+                               group_size: int = 1) -> List[ExecutionResult]:
+        """
+        Esperar las ejecuciones a medida que terminan, conservando el orden de la suite.
+        
+        Con group_size > 1, cada grupo consecutivo de ejecuciones (las iteraciones
+        de una pregunta) se agrega en un único resultado apenas termina su última
+        ejecución. Cada resultado final se incorpora al resumen en ese momento.
+        """
+        async def indexed(index: int, task) -> Tuple[int, ExecutionResult]:
+            return index, await task
+        
+        flat_results: List[Optional[ExecutionResult]] = [None] * len(tasks)
+        results: List[Optional[ExecutionResult]] = [None] * (len(tasks) // group_size)
+        pending = [group_size] * len(results)
+        
+        for next_done in asyncio.as_completed([indexed(i, task) for i, task in enumerate(tasks)]):
+            index, result = await next_done
             
-            # Execute multiple iterations if requested
-            question_results = []
-            for iteration in range(iterations):
-                iteration_session = f"{session_id}_q{i+1}_iter{iteration+1}"
-                
-                try:
-                    result = asyncio.run(self._execute_question(
-                        question, agent_type, iteration_session
-                    ))
-                    question_results.append(result)
-                    
-                except Exception as e:
-                    error_result = self._create_error_result(
-                        question=question,
-                        question_id=question.id,
-                        error=str(e),
-                        session_id=iteration_session,
-                        execution_time=0.0
-                    )
-                    question_results.append(error_result)
+            if group_size == 1:
+                results[index] = result
+                summary.update(result)
+                continue
             
-            # If multiple iterations, aggregate results
-            if iterations == 1:
-                results.extend(question_results)
-            else:
-                # Create aggregated result
-                aggregated_result = self._aggregate_question_results(question_results)
-                results.append(aggregated_result)
+            flat_results[index] = result
+            group = index // group_size
+            pending[group] -= 1
+            if pending[group] == 0:
+                start = group * group_size
+                results[group] = self._aggregate_question_results(flat_results[start:start + group_size])
+                summary.update(results[group])
         
         return results
     
-    def _run_with_both_agents(self, suite: TestSuite, iterations: int, 
-                             session_id: str) -> List[ExecutionResult]:
-        """Ejecutar suite con ambos agentes."""
-        results = []
-        
-        for i, question in enumerate(suite.questions):
-            print(f"📝 Pregunta {i+1}/{len(suite.questions)} (ambos agentes): {question.question[:80]}...")
-            
-            # Execute with Orchestrator
+    async def _execute_guarded(self, semaphore: asyncio.Semaphore, question, agent_type: AgentType,
+                               session_id: str, question_id: str,
+                               educational_context: Dict[str, Any],
+                               announce: Optional[str] = None,
+                               agent_used: Optional[str] = None) -> ExecutionResult:
+        """Ejecutar una pregunta dentro del semáforo, convirtiendo excepciones en resultados de error."""
+        async with semaphore:
+            if announce:
+                print(announce)
             try:
-                orchestrator_result = asyncio.run(self._execute_question(
-                    question, AgentType.ORCHESTRATOR, f"{session_id}_q{i+1}_orchestrator"
-                ))
-                orchestrator_result.agent_metadata['agent_used'] = 'orchestrator'
-                results.append(orchestrator_result)
+                result = await self._execute_question(
+                    question, agent_type, session_id, educational_context
+                )
             except Exception as e:
-                error_result = self._create_error_result(
+                result = self._create_error_result(
                     question=question,
-                    question_id=f"{question.id}_orchestrator",
+                    question_id=question_id,
                     error=str(e),
-                    session_id=f"{session_id}_q{i+1}_orchestrator",
-                    execution_time=0.0
+                    session_id=session_id,
+                    execution_time=0.0,
+                    educational_context=educational_context
                 )
-                error_result.agent_metadata['agent_used'] = 'orchestrator'
-                results.append(error_result)
+        
+        if agent_used:
+            result.agent_metadata['agent_used'] = agent_used
+        return result
+    
+    async def _run_with_single_agent(self, suite: TestSuite, agent_type: AgentType,
+                                     iterations: int, session_id: str,
+                                     semaphore: asyncio.Semaphore,
+                                     summary: SummaryAccumulator) -> List[ExecutionResult]:
+        """Ejecutar suite con un solo agente."""
+        total = len(suite.questions)
+        
+        # Schedule every iteration of every question, grouped by question
+        tasks = []
+        for i, question in enumerate(suite.questions):
+            announce = f"📝 Pregunta {i+1}/{total}: {question.question[:80]}..."
+            educational_context = self._educational_context(question)
+            question_session = f"{session_id}_q{i+1}"
+            for iteration in range(iterations):
+                tasks.append(self._execute_guarded(
+                    semaphore, question, agent_type,
+                    f"{question_session}_iter{iteration+1}", question.id,
+                    educational_context, announce if iteration == 0 else None
+                ))
+        
+        # If multiple iterations, each question's results are aggregated
+        return await self._collect_results(tasks, summary, group_size=iterations)
+    
+    async def _run_with_both_agents(self, suite: TestSuite, iterations: int,
+                                    session_id: str,
+                                    semaphore: asyncio.Semaphore,
+                                    summary: SummaryAccumulator) -> List[ExecutionResult]:
+        """Ejecutar suite con ambos agentes."""
+        total = len(suite.questions)
+        
+        tasks = []
+        for i, question in enumerate(suite.questions):
+            announce = f"📝 Pregunta {i+1}/{total} (ambos agentes): {question.question[:80]}..."
+            educational_context = self._educational_context(question)
+            question_session = f"{session_id}_q{i+1}"
+            
+            # Execute with Orchestrator
+            tasks.append(self._execute_guarded(
+                semaphore, question, AgentType.ORCHESTRATOR,
+                f"{question_session}_orchestrator", f"{question.id}_orchestrator",
+                educational_context, announce, agent_used='orchestrator'
+            ))
             
             # Execute with GapAnalyzer (if applicable)
             if question.practice_id:  # Only run GapAnalyzer for questions with practice context
-                try:
-                    gapanalyzer_result = asyncio.run(self._execute_question(
-                        question, AgentType.GAPANALYZER, f"{session_id}_q{i+1}_gapanalyzer"
-                    ))
-                    gapanalyzer_result.agent_metadata['agent_used'] = 'gapanalyzer'
-                    results.append(gapanalyzer_result)
-                except Exception as e:
-                    error_result = self._create_error_result(
-                        question=question,
-                        question_id=f"{question.id}_gapanalyzer",
-                        error=str(e),
-                        session_id=f"{session_id}_q{i+1}_gapanalyzer",
-                        execution_time=0.0
-                    )
-                    error_result.agent_metadata['agent_used'] = 'gapanalyzer'
-                    results.append(error_result)
+                tasks.append(self._execute_guarded(
+                    semaphore, question, AgentType.GAPANALYZER,
+                    f"{question_session}_gapanalyzer", f"{question.id}_gapanalyzer",
+                    educational_context, agent_used='gapanalyzer'
+                ))
         
-        return results
+        return await self._collect_results(tasks, summary)
     
     async def _execute_question(self, question, agent_type: AgentType, 
-                               session_id: str) -> ExecutionResult:
+                               session_id: str,
+                               educational_context: Optional[Dict[str, Any]] = None) -> ExecutionResult:
         """Ejecutar una pregunta individual contra un agente."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        if educational_context is None:
+            educational_context = self._educational_context(question)
         
         try:
             # Prepare context
@@ -304,32 +411,15 @@ class TestRunner:
             else:
                 raise ValueError(f"Tipo de agente no soportado: {agent_type}")
             
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
-            # Collect metrics
-            metrics = self.metrics_collector.collect_question_metrics(
+            # Collect metrics in a worker thread: the expected answer
+            # evaluation is a blocking LLM call
+            metrics = await asyncio.to_thread(
+                self.metrics_collector.collect_question_metrics,
                 question, response, agent_type, execution_time
             )
             
-            # Create trace in Langfuse if enabled
-            langfuse_trace_id = None
-            if self.langfuse_enabled:
-                try:
-                    langfuse_trace_id = self.langfuse_manager.create_trace_for_question(
-                        question.question,
-                        response.get('content', ''),
-                        {
-                            'agent_type': agent_type.value,
-                            'session_id': session_id,
-                            'subject': question.subject,
-                            'difficulty': question.difficulty.value,
-                            'execution_time': execution_time,
-                            'metrics': metrics
-                        }
-                    )
-                except Exception as e:
-                    print(f"⚠️ Error creando trace en Langfuse: {e}")
-            
             return ExecutionResult(
                 question_id=question.id,
                 question_text=question.question,
@@ -339,18 +429,13 @@ class TestRunner:
                 session_id=session_id,
                 metrics=metrics,
                 agent_metadata=response.get('metadata', {}),
-                langfuse_trace_id=langfuse_trace_id,
                 
                 # Educational context from original question
-                subject=question.subject,
-                difficulty=question.difficulty.value if hasattr(question.difficulty, 'value') else str(question.difficulty),
-                practice_id=question.practice_id,
-                exercise_section=question.exercise_section,
-                tags=question.tags
+                **educational_context
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             return ExecutionResult(
                 question_id=question.id,
@@ -361,30 +446,27 @@ class TestRunner:
                 session_id=session_id,
                 
                 # Educational context from original question
-                subject=question.subject,
-                difficulty=question.difficulty.value if hasattr(question.difficulty, 'value') else str(question.difficulty),
-                practice_id=question.practice_id,
-                exercise_section=question.exercise_section,
-                tags=question.tags
+                **educational_context
             )
     
     async def _execute_with_orchestrator(self, question, context: Dict[str, Any]) -> Dict[str, Any]:
         """Ejecutar pregunta con Orchestrator."""
         request = {'message': question.question}
         
-        # Collect streaming response
-        final_response = ""
-        metadata = {}
+        # Keep only the completion chunk; aclosing shuts the stream down right after it
+        final_chunk = None
+        async with aclosing(self.orchestrator.stream(request=request, context=context)) as stream:
+            async for chunk in stream:
+                if chunk.get('is_task_complete'):
+                    final_chunk = chunk
+                    break
         
-        async for chunk in self.orchestrator.stream(request=request, context=context):
-            if chunk.get('is_task_complete'):
-                final_response = chunk.get('content', '')
-                metadata = chunk.get('metadata', {})
-                break
+        if final_chunk is None:
+            return {'content': "", 'metadata': {}}
         
         return {
-            'content': final_response,
-            'metadata': metadata
+            'content': final_chunk.get('content', ''),
+            'metadata': final_chunk.get('metadata', {})
         }
     
     async def _execute_with_gapanalyzer(self, question, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -393,26 +475,23 @@ class TestRunner:
         if not question.practice_id:
             raise ValueError("GapAnalyzer requiere practice_id en la pregunta")
         
-        # Create message with practice context
-        message_content = f"practice_id:{question.practice_id}|exercise_section:{question.exercise_section or '1.a'}|query:{question.question}"
-        
         # Execute using agent's stream method
         try:
             # Use the agent's stream method and collect the final response
             context_id = context.get('session_id', 'test_session')
             
-            final_response = ""
-            async for chunk in self.gapanalyzer.agent.stream(question.question, context_id):
-                if chunk.get('is_task_complete', False):
-                    final_response = chunk.get('content', '')
-                    break
-                elif chunk.get('content'):
-                    # This is a progress update, we can ignore or log it
-                    pass
+            # Progress updates are skipped; only the last chunk seen is kept
+            last_chunk = None
+            async with aclosing(self.gapanalyzer.agent.stream(question.question, context_id)) as stream:
+                async for chunk in stream:
+                    last_chunk = chunk
+                    if chunk.get('is_task_complete', False):
+                        break
             
-            if not final_response:
-                # If we didn't get a final response, try to get the last content
-                final_response = chunk.get('content', 'No response generated')
+            if last_chunk is None:
+                final_response = 'No response generated'
+            else:
+                final_response = last_chunk.get('content', 'No response generated')
             
             return {
                 'content': final_response,
@@ -448,15 +527,16 @@ class TestRunner:
         # Aggregate metrics
         aggregated_metrics = {}
         if successful_runs:
-            # Average numeric metrics
+            # Gather numeric metrics column-wise in a single pass
+            columns = defaultdict(list)
             for result in successful_runs:
                 for key, value in result.metrics.items():
                     if isinstance(value, (int, float)):
-                        aggregated_metrics[key] = aggregated_metrics.get(key, 0) + value
+                        columns[key].append(value)
             
-            # Average the values
-            for key in aggregated_metrics:
-                aggregated_metrics[key] /= len(successful_runs)
+            # Average over all successful runs (a metric missing from a run counts as 0)
+            n = len(successful_runs)
+            aggregated_metrics = {key: sum(values) / n for key, values in columns.items()}
         
         # Add iteration metadata
         aggregated_metrics['iterations_run'] = len(results)
@@ -495,8 +575,7 @@ class TestRunner:
         Returns:
             Resultado de validación
         """
-        suite_data = self.suite_manager.get_suite(suite_name)
-        suite = TestSuite(**suite_data)
+        suite = self._load_suite(suite_name)
         
         validation_result = {
             'valid': True,
@@ -506,19 +585,17 @@ class TestRunner:
             'total_questions': len(suite.questions)
         }
         
-        for question in suite.questions:
-            question_valid = True
-            
-            if agent_type == AgentType.GAPANALYZER:
-                # GapAnalyzer requires practice_id
-                if not question.practice_id:
-                    validation_result['warnings'].append(
-                        f"Pregunta '{question.id}' no tiene practice_id para GapAnalyzer"
-                    )
-                    question_valid = False
-            
-            if question_valid:
-                validation_result['compatible_questions'] += 1
+        if agent_type == AgentType.GAPANALYZER:
+            # GapAnalyzer requires practice_id
+            missing = [question.id for question in suite.questions if not question.practice_id]
+            validation_result['warnings'] = [
+                f"Pregunta '{question_id}' no tiene practice_id para GapAnalyzer"
+                for question_id in missing
+            ]
+            validation_result['compatible_questions'] = len(suite.questions) - len(missing)
+        else:
+            # No per-question requirements for the other agents
+            validation_result['compatible_questions'] = len(suite.questions)
         
         if validation_result['compatible_questions'] == 0:
             validation_result['valid'] = False
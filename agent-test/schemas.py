@@ -79,9 +79,9 @@ class TestSuite(BaseModel):
         return len(self.questions)
     
     def get_subjects(self) -> List[str]:
-        """Obtener lista de materias únicas en la suite."""
-        subjects = {q.subject for q in self.questions if q.subject}
-        return list(subjects)
+        """Obtener lista de materias únicas en la suite, en orden de aparición."""
+        # Not memoized: questions is a plain list that callers may mutate in place
+        return list(dict.fromkeys(q.subject for q in self.questions if q.subject))
 
 class ExecutionResult(BaseModel):
     """Resultado de ejecutar una pregunta individual."""
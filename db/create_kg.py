@@ -1,284 +1,462 @@
 import os
 import ast
+import hashlib
 import pickle
+import struct
 import pandas as pd
 import json
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import openai
 from neo4j import GraphDatabase
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Modelo, dimensiones de sus vectores y cantidad máxima de textos por request
+# al endpoint de embeddings
+EMBEDDING_MODEL = "text-embedding-ada-002"
+EMBEDDING_DIMENSIONS = 1536
+EMBEDDING_BATCH_SIZE = 256
+
+# Filas enviadas por sentencia al escribir una hoja en Neo4j
+WRITE_CHUNK_SIZE = 10000
+
+# Encabezado de cada registro del cache: largo de la clave y dimensiones.
+# Le siguen la clave (hash del texto) y el embedding como float32.
+CACHE_RECORD_HEADER = struct.Struct("=II")
+
+# Hojas leídas de cada planilla
+PROGRAMA_SHEETS = ["Cabecera", "Objetivos", "UnidadesTematicas", "Temas"]
+PRACTICAS_SHEETS = ["Cabecera", "TipsNivelPractica", "Enunciado"]
+
+# Claves usadas en MERGE (únicas) y propiedades usadas para buscar nodos en MATCH
+UNIQUE_KEYS = [("Materia", "nombre"), ("Carrera", "nombre"), ("Profesor", "nombre")]
+LOOKUP_KEYS = [
+    ("UnidadTematica", "numero"),
+    ("Tema", "descripcion"),
+    ("Practica", "numeropractica"),
+    ("SeccionPractica", "numero"),
+    ("Document", "fileName"),
+    ("Tip", "texto")
+]
+
+# Labels que se borran antes de cada carga
+LABELS = [
+    "Materia", "Carrera", "Profesor", "ObjetivoMateria", "UnidadTematica",
+    "Tema", "Practica", "Tip", "SeccionPractica",
+    "Seccion","Ejercicio", "Respuesta"
+]
+
+# Propiedades con embedding y su vector index: (label, propiedad)
+EMBEDDING_TARGETS = [
+    ("ObjetivoMateria", "descripcion"),
+    ("UnidadTematica", "titulo"),
+    ("Tema", "descripcion"),
+    ("Practica", "descripcion"),
+    ("Practica", "objetivos"),
+    ("Tip", "texto"),
+    ("SeccionPractica", "enunciado"),
+    ("Ejercicio", "enunciado"),
+    ("Respuesta", "texto")
+]
+
+# Las sentencias que dependen de un label se arman una sola vez, al importar el módulo
+CLEAR_QUERIES = [f"MATCH (n:{label}) DETACH DELETE n" for label in LABELS]
+SCHEMA_QUERIES = [
+    f"CREATE CONSTRAINT {label.lower()}_{prop.lower()} IF NOT EXISTS "
+    f"FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+    for label, prop in UNIQUE_KEYS
+] + [
+    f"CREATE INDEX {label.lower()}_{prop.lower()} IF NOT EXISTS "
+    f"FOR (n:{label}) ON (n.{prop})"
+    for label, prop in LOOKUP_KEYS
+]
+VECTOR_INDEX_QUERIES = [
+    f"CREATE VECTOR INDEX idx_{label}_{prop} IF NOT EXISTS FOR (n:{label}) ON (n.embedding_{prop}) "
+    f"OPTIONS {{ indexConfig: {{`vector.dimensions`: {EMBEDDING_DIMENSIONS},`vector.similarity_function`: 'cosine'}}}}"
+    for label, prop in EMBEDDING_TARGETS
+]
+# Por cada propiedad: lectura de los textos que todavía no tienen embedding y
+# escritura de los embeddings
+EMBEDDING_QUERIES = [
+    (
+        f"MATCH (n:{label}) WHERE n.{prop} IS NOT NULL AND n.embedding_{prop} IS NULL "
+        f"RETURN n.{prop} AS text, id(n) AS id",
+        f"UNWIND $rows AS r MATCH (n:{label}) WHERE id(n) = r.id SET n.embedding_{prop} = r.emb"
+    )
+    for label, prop in EMBEDDING_TARGETS
+]
+
+# Sentencias de carga de cada hoja; el texto fijo permite reutilizar el plan en el servidor
+CABECERA_QUERY = (
+    "UNWIND $rows AS r "
+    "MERGE (m:Materia {nombre: r.nombre}) "
+    "MERGE (n:Carrera {nombre: r.carrera}) "
+    "MERGE (m)-[:HAS_CARRERA]->(n) "
+    "WITH m, r UNWIND r.profesores AS profesor "
+    "MERGE (p:Profesor {nombre: profesor}) "
+    "MERGE (m)-[:HAS_PROFESOR]->(p)"
+)
+OBJETIVOS_QUERY = (
+    "MATCH (m:Materia {nombre: $nombre}) "
+    "UNWIND $rows AS texto "
+    "CREATE (o:ObjetivoMateria {descripcion: texto}) "
+    "MERGE (m)-[:HAS_OBJETIVO]->(o)"
+)
+UNIDADES_QUERY = (
+    "MATCH (m:Materia {nombre: $nombre}) "
+    "UNWIND $rows AS r "
+    "CREATE (u:UnidadTematica {numero: r.num, titulo: r.titulo}) "
+    "MERGE (m)-[:HAS_UNIDAD_TEMATICA]->(u)"
+)
+TEMAS_QUERY = (
+    "UNWIND $rows AS r "
+    "CREATE (t:Tema {descripcion: r.texto}) "
+    "WITH t, r "
+    "MATCH (u:UnidadTematica {numero: r.num}) "
+    "MERGE (u)-[:HAS_TEMA]->(t)"
+)
+APUNTES_QUERY = (
+    "UNWIND $rows AS r "
+    "MATCH (t:Tema {descripcion: r.texto}), (d:Document {fileName: r.file}) "
+    "MERGE (t)-[:APUNTE]->(d)"
+)
+PRACTICAS_QUERY = (
+    "UNWIND $rows AS r "
+    "CREATE (p:Practica) SET p = r.props "
+    "WITH p, r UNWIND r.temas AS tema "
+    "MATCH (t:Tema {descripcion: tema}) "
+    "MERGE (p)-[:HAS_TEMA]->(t)"
+)
+# Un mismo tip es un único nodo, vinculado a cada práctica, sección o ejercicio que lo usa
+TIPS_PRACTICA_QUERY = (
+    "UNWIND $rows AS r "
+    "MERGE (tip:Tip {texto: r.texto}) "
+    "WITH tip, r "
+    "MATCH (p:Practica {numeropractica: r.num}) "
+    "MERGE (p)-[:HAS_TIP]->(tip)"
+)
+SECCIONES_QUERY = (
+    "UNWIND $rows AS r "
+    "CREATE (s:SeccionPractica {numero: r.sec, enunciado: r.enc}) "
+    "FOREACH (texto IN r.tips | MERGE (tip:Tip {texto: texto}) MERGE (s)-[:HAS_TIP]->(tip)) "
+    "WITH s, r "
+    "MATCH (p:Practica {numeropractica: r.num}) "
+    "MERGE (p)-[:HAS_SECCION]->(s)"
+)
+EJERCICIOS_QUERY = (
+    "UNWIND $rows AS r "
+    "CREATE (e:Ejercicio {numero: r.ej, enunciado: r.enc}) "
+    "FOREACH (texto IN r.respuestas | CREATE (e)-[:HAS_RESPUESTA]->(:Respuesta {texto: texto})) "
+    "FOREACH (texto IN r.tips | MERGE (tip:Tip {texto: texto}) MERGE (e)-[:HAS_TIP]->(tip)) "
+    "WITH e, r "
+    "MATCH (:Practica {numeropractica: r.num})-[:HAS_SECCION]->(s:SeccionPractica {numero: r.sec}) "
+    "MERGE (s)-[:HAS_EJERCICIO]->(e)"
+)
+
 def crear_kg(
     neo4j_uri: str,
     neo4j_user: str,
     neo4j_password: str,
     programa_path: str,
     practicas_path: str,
-    embedding_cache_path: str = "embeddings_cache.pkl"
+    embedding_cache_path: str = "embeddings_cache.bin"
 ):
+    # Leer ambas planillas en segundo plano mientras se prepara el grafo
+    executor = ThreadPoolExecutor(max_workers=2)
+    programa_future = executor.submit(pd.read_excel, programa_path, sheet_name=PROGRAMA_SHEETS)
+    practicas_future = executor.submit(pd.read_excel, practicas_path, sheet_name=PRACTICAS_SHEETS)
+    executor.shutdown(wait=False)
+
     # Conectar a Neo4j
     driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
 
     with driver.session() as session:
         # 1. Limpiar grafo actual (labels involucrados)
-        labels = [
-            "Materia", "Carrera", "Profesor", "ObjetivoMateria", "UnidadTematica",
-            "Tema", "Practica", "Tip", "SeccionPractica",
-            "Seccion","Ejercicio", "Respuesta"
-        ]
-        for label in labels:
-            session.run(f"MATCH (n:{label}) DETACH DELETE n")
+        for query in CLEAR_QUERIES:
+            session.run(query)
+
+        # Constraints e índices (no-op si ya existen)
+        for query in SCHEMA_QUERIES:
+            session.run(query)
 
         # 2. Procesar Programa.xlsx
-        excel_prog = pd.ExcelFile(programa_path)
+        # Cada hoja se carga en una única transacción, con sentencias UNWIND sobre la lista de filas
+        programa = programa_future.result()
 
         # Cabecera
-        df_cab = excel_prog.parse("Cabecera")
-        for _, row in df_cab.iterrows():
-            materia_props = {"nombre": row["Materia"]}
-            session.run(
-            "MERGE (m:Materia {nombre: $nombre})",
-            materia_props
-            )
-            # Carrera (asume valor único)
-            valor_carrera = row["Carrera"]
-            session.run(
-            "MERGE (n:Carrera {nombre: $valor})",
-            {"valor": valor_carrera}
-            )
-            session.run(
-            "MATCH (m:Materia {nombre: $nombre}), (n:Carrera {nombre: $valor}) "
-            "MERGE (m)-[:HAS_CARRERA]->(n)",
-            {"nombre": row["Materia"], "valor": valor_carrera}
-            )
-            # Profesor (puede ser lista)
-            profesores = row["Profesor"]
-            if isinstance(profesores, str):
-                try:
-                    profesores = ast.literal_eval(profesores)
-                except Exception:
-                    profesores = [profesores]
-            if not isinstance(profesores, list):
-                profesores = [profesores]
-            for profesor in profesores:
-                session.run(
-                    "MERGE (n:Profesor {nombre: $valor})",
-                    {"valor": profesor}
-                )
-                session.run(
-                    "MATCH (m:Materia {nombre: $nombre}), (n:Profesor {nombre: $valor}) "
-                    "MERGE (m)-[:HAS_PROFESOR]->(n)",
-                    {"nombre": row["Materia"], "valor": profesor}
-                )
+        df_cab = programa["Cabecera"]
+        cabecera_rows = []
+        cabecera_records = df_cab.to_dict("records")
+        # Objetivos y unidades se vinculan a la materia de la primera fila
+        materia_nombre = cabecera_records[0]["Materia"]
+        for row in cabecera_records:
+            # Carrera (asume valor único); Profesor (puede ser lista)
+            cabecera_rows.append({
+                "nombre": row["Materia"],
+                "carrera": row["Carrera"],
+                "profesores": _parse_list(row["Profesor"])
+            })
+        session.execute_write(_write_rows, [(
+            CABECERA_QUERY,
+            {"rows": cabecera_rows}
+        )])
 
         # Objetivos
-        df_obj = excel_prog.parse("Objetivos")
-        for _, row in df_obj.iterrows():
-            session.run(
-                "CREATE (o:ObjetivoMateria {descripcion: $desc})",
-                {"desc": row["Objetivo"]}
-            )
-            session.run(
-                "MATCH (m:Materia {nombre: $nombre}), (o:ObjetivoMateria {descripcion: $desc}) "
-                "MERGE (m)-[:HAS_OBJETIVO]->(o)",
-                {"nombre": df_cab.at[0, "Materia"], "desc": row["Objetivo"]}
-            )
+        df_obj = programa["Objetivos"]
+        session.execute_write(_write_rows, [(
+            OBJETIVOS_QUERY,
+            {"nombre": materia_nombre, "rows": df_obj["Objetivo"].tolist()}
+        )])
 
         # UnidadesTematicas
-        df_ut = excel_prog.parse("UnidadesTematicas")
-        for _, row in df_ut.iterrows():
-            session.run(
-                "CREATE (u:UnidadTematica {numero: $num, titulo: $titulo})",
-                {"num": int(row["Numero"]), "titulo": row["Titulo"]}
-            )
-            session.run(
-                "MATCH (m:Materia {nombre: $nombre}), (u:UnidadTematica {numero: $num}) "
-                "MERGE (m)-[:HAS_UNIDAD_TEMATICA]->(u)",
-                {"nombre": df_cab.at[0, "Materia"], "num": int(row["Numero"])}
-            )
+        df_ut = programa["UnidadesTematicas"]
+        session.execute_write(_write_rows, [(
+            UNIDADES_QUERY,
+            {
+                "nombre": materia_nombre,
+                "rows": [{"num": int(row["Numero"]), "titulo": row["Titulo"]} for row in df_ut.to_dict("records")]
+            }
+        )])
 
         # Temas
-        df_temas = excel_prog.parse("Temas")
-        for _, row in df_temas.iterrows():
-            session.run(
-                "CREATE (t:Tema {descripcion: $texto})",
-                {"texto": row["Tema"]}
-            )
-            session.run(
-                "MATCH (u:UnidadTematica {numero: $num}), (t:Tema {descripcion: $texto}) "
-                "MERGE (u)-[:HAS_TEMA]->(t)",
-                {"num": int(row["NumeroUnidadTematica"]), "texto": row["Tema"]}
-            )
+        df_temas = programa["Temas"]
+        temas_rows = []
+        apuntes_rows = []
+        for row in df_temas.to_dict("records"):
+            temas_rows.append({"num": int(row["NumeroUnidadTematica"]), "texto": row["Tema"]})
             # ApunteRelacionado es lista de strings, puede estar vacío o NaN
-            referencias = row.get("Apunte Relacionado")
-            if pd.notna(referencias) and str(referencias).strip():
-                try:
-                    referencias = ast.literal_eval(referencias)
-                except Exception:
-                    referencias = [referencias]
-                if not isinstance(referencias, list):
-                    referencias = [referencias]
-                for doc in referencias:
-                    session.run(
-                        "MATCH (t:Tema {descripcion: $texto}), (d:Document {fileName: $file}) "
-                        "MERGE (t)-[:APUNTE]->(d)",
-                        {"texto": row["Tema"], "file": doc}
-                    )
+            for doc in _parse_list(row.get("Apunte Relacionado")):
+                apuntes_rows.append({"texto": row["Tema"], "file": doc})
+        session.execute_write(_write_rows, [(
+            TEMAS_QUERY,
+            {"rows": temas_rows}
+        ), (
+            APUNTES_QUERY,
+            {"rows": apuntes_rows}
+        )])
 
         # 3. Procesar Prácticas Bases de Datos.xlsx
-        excel_prac = pd.ExcelFile(practicas_path)
+        practicas = practicas_future.result()
 
         # Cabecera
-        df_pcab = excel_prac.parse("Cabecera")
-        for _, row in df_pcab.iterrows():
-            props = {col.lower().replace(" ", "_"): row[col] for col in df_pcab.columns}
-            session.run("CREATE (p:Practica $props)", {"props": props})
+        df_pcab = practicas["Cabecera"]
+        practicas_rows = []
+        for row in df_pcab.to_dict("records"):
+            props = {col.lower().replace(" ", "_"): value for col, value in row.items()}
             # Teoría Relacionada
-            temas_rel = ast.literal_eval(row["Teoria Relacionada"])
-            for tema in temas_rel:
-                session.run(
-                    "MATCH (p:Practica {numeropractica: $num}), (t:Tema {descripcion: $tema}) "
-                    "MERGE (p)-[:HAS_TEMA]->(t)",
-                    {"num": row["NumeroPractica"], "tema": tema}
-                )
+            practicas_rows.append({"props": props, "temas": _parse_list(row["Teoria Relacionada"])})
+        session.execute_write(_write_rows, [(
+            PRACTICAS_QUERY,
+            {"rows": practicas_rows}
+        )])
 
         # TipsNivelPractica
-        df_tips = excel_prac.parse("TipsNivelPractica")
-        for _, row in df_tips.iterrows():
-            session.run(
-                "CREATE (tip:Tip {texto: $texto})",
-                {"texto": row["Tip"]}
-            )
-            session.run(
-                "MATCH (p:Practica {numeropractica: $num}), (tip:Tip {texto: $texto}) "
-                "MERGE (p)-[:HAS_TIP]->(tip)",
+        df_tips = practicas["TipsNivelPractica"]
+        session.execute_write(_write_rows, [(
+            TIPS_PRACTICA_QUERY,
+            {"rows": [
                 {"num": row["NumeroPractica"], "texto": row["Tip"]}
-            )
+                for row in df_tips.to_dict("records")
+                if pd.notna(row["Tip"])
+            ]}
+        )])
 
         # Enunciado (Secciones y Ejercicios)
-        df_en = excel_prac.parse("Enunciado")
-        for _, row in df_en.iterrows():
+        df_en = practicas["Enunciado"]
+        secciones_rows = []
+        ejercicios_rows = []
+        for row in df_en.to_dict("records"):
+            # Tips nivel sección / ejercicio
+            tips = _parse_list(row.get("Tips Nivel Ejercicio"))
             if row["Tipo"] == "S":
                 # SeccionPractica
-                session.run(
-                    "CREATE (s:SeccionPractica {numero: $sec, enunciado: $enc})",
-                    {"sec": str(row["Seccion"]), "enc": row["Enunciado"]}
-                )
-                session.run(
-                    "MATCH (p:Practica {numeropractica: $num}), (s:SeccionPractica {numero: $sec}) "
-                    "MERGE (p)-[:HAS_SECCION]->(s)",
-                    {"num": row["NumeroPractica"], "sec": str(row["Seccion"])}
-                )
-                # Tips nivel sección
-                tips_sec = row.get("Tips Nivel Ejercicio")
-                if pd.notna(tips_sec) and str(tips_sec).strip():
-                    try:
-                        tips_sec = ast.literal_eval(tips_sec)
-                    except Exception:
-                        tips_sec = [tips_sec]
-                    if not isinstance(tips_sec, list):
-                        tips_sec = [tips_sec]
-                    for tip in tips_sec:
-                        session.run(
-                            "CREATE (t:Tip {texto: $texto})",
-                            {"texto": tip}
-                        )
-                        session.run(
-                            "MATCH (s:SeccionPractica {numero: $sec})-[]-(p:Practica {numeropractica: $num}), (t:Tip {texto: $texto}) "
-                            "MERGE (s)-[:HAS_TIP]->(t)",
-                            {"sec": str(row["Seccion"]), "num": int(row["NumeroPractica"]), "texto": tip}
-                        )
+                secciones_rows.append({
+                    "num": int(row["NumeroPractica"]),
+                    "sec": str(row["Seccion"]),
+                    "enc": row["Enunciado"],
+                    "tips": tips
+                })
             else:
-                # Ejercicio
-                session.run(
-                    "CREATE (e:Ejercicio {numero: $ej, enunciado: $enc})",
-                    {"ej": str(row["Ejercicio"]), "enc": row["Enunciado"]}
-                )
-                session.run(
-                    "MATCH (s:SeccionPractica {numero: $sec})-[]-(p:Practica {numeropractica: $num}), (e:Ejercicio {numero: $ej, enunciado: $enc}) "
-                    "MERGE (s)-[:HAS_EJERCICIO]->(e)",
-                    {"sec": str(row["Seccion"]), "num": int(row["NumeroPractica"]), "ej": str(row["Ejercicio"]), "enc": row["Enunciado"]}
-                )
                 # Respuestas
                 try:
-                    respuestas = json.loads(row["Respuesta"])
+                    respuestas = _json_loads(row["Respuesta"])
                 except Exception:
                     respuestas = [row["Respuesta"]]
-                for resp in respuestas:
-                    session.run(
-                        "CREATE (r:Respuesta {texto: $texto})",
-                        {"texto": resp}
-                    )
-                    session.run(
-                        "MATCH (e:Ejercicio {numero: $ej})-[]-(s:SeccionPractica {numero: $sec})-[]-(p:Practica {numeropractica: $num}), (r:Respuesta {texto: $texto}) "
-                        "MERGE (e)-[:HAS_RESPUESTA]->(r)",
-                        {"ej": str(row["Ejercicio"]), "sec": str(row["Seccion"]), "num": int(row["NumeroPractica"]), "texto": resp}
-                    )
-                # Tips nivel ejercicio
-                tips_ej = row.get("Tips Nivel Ejercicio")
-                if pd.notna(tips_ej) and str(tips_ej).strip():
-                    try:
-                        tips_ej = ast.literal_eval(tips_ej)
-                    except Exception:
-                        tips_ej = [tips_ej]
-                    if not isinstance(tips_ej, list):
-                        tips_ej = [tips_ej]
-                    for tip in tips_ej:
-                        session.run(
-                            "CREATE (t:Tip {texto: $texto})",
-                            {"texto": tip}
-                        )
-                        session.run(
-                            "MATCH (e:Ejercicio {numero: $ej})-[]-(s:SeccionPractica {numero: $sec})-[]-(p:Practica {numeropractica: $num}), (t:Tip {texto: $texto}) "
-                            "MERGE (e)-[:HAS_TIP]->(t)",
-                            {"ej": str(row["Ejercicio"]), "sec": str(row["Seccion"]), "num": int(row["NumeroPractica"]), "texto": tip}
-                        )
+                if not isinstance(respuestas, list):
+                    respuestas = [respuestas]
+                ejercicios_rows.append({
+                    "num": int(row["NumeroPractica"]),
+                    "sec": str(row["Seccion"]),
+                    "ej": str(row["Ejercicio"]),
+                    "enc": row["Enunciado"],
+                    "respuestas": respuestas,
+                    "tips": tips
+                })
+        # Cada sección se vincula a la práctica de su fila, y cada ejercicio a la
+        # sección con su número dentro de esa práctica
+        session.execute_write(_write_rows, [(
+            SECCIONES_QUERY,
+            {"rows": secciones_rows}
+        ), (
+            EJERCICIOS_QUERY,
+            {"rows": ejercicios_rows}
+        )])
 
         # 4. Crear embeddings y vector index
         create_embeddings(session, embedding_cache_path)
     driver.close()
 
+def _write_rows(tx, statements):
+    """
+    Ejecutar en la transacción tx una lista de sentencias (query, params).
+
+    Cada query recorre params["rows"] con UNWIND; las filas se envían en tramos
+    de WRITE_CHUNK_SIZE para no armar mensajes Bolt demasiado grandes.
+    """
+    for query, params in statements:
+        rows = params["rows"]
+        for start in range(0, len(rows), WRITE_CHUNK_SIZE):
+            tx.run(query, {**params, "rows": rows[start:start + WRITE_CHUNK_SIZE]})
+
+def _parse_list(value):
+    """
+    Interpretar una celda con una lista en sintaxis Python, p. ej. "['a', 'b']".
+
+    Las celdas vacías o NaN dan una lista vacía y cualquier otro valor que no
+    sea una lista se devuelve como lista de un elemento.
+    """
+    if not isinstance(value, str):
+        return [value] if pd.notna(value) else []
+    if not value.strip():
+        return []
+    try:
+        parsed = _literal_list(value)
+    except Exception:
+        parsed = value
+    return parsed if isinstance(parsed, list) else [parsed]
+
+def _json_loads(text):
+    """Decodificar JSON con orjson si está disponible, o con json."""
+    return orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
+
+def _literal_list(value):
+    """
+    Evaluar un literal Python como ast.literal_eval, con un atajo para listas simples.
+
+    Sin barras invertidas, una lista con strings de un solo tipo de comillas
+    es JSON válido al usar comillas dobles, y se decodifica sin pasar por el
+    parser de Python. Cualquier otro caso (o un error) usa ast.literal_eval.
+    """
+    stripped = value.strip()
+    if stripped.startswith("[") and stripped.endswith("]") and "\\" not in stripped:
+        if '"' not in stripped:
+            candidate = stripped.replace("'", '"')
+        elif "'" not in stripped:
+            candidate = stripped
+        else:
+            candidate = None
+        if candidate is not None:
+            try:
+                return _json_loads(candidate)
+            except ValueError:
+                pass
+    return ast.literal_eval(value)
+
 def create_embeddings(session, cache_path):
     # Cargar o inicializar cache
-    if os.path.exists(cache_path):
-        with open(cache_path, "rb") as f:
-            cache = pickle.load(f)
-    else:
-        cache = {}
-
-    target_nodes = [
-        ("ObjetivoMateria", "descripcion"),
-        ("UnidadTematica", "titulo"),
-        ("Tema", "descripcion"),
-        ("Practica", "descripcion"),
-        ("Practica", "objetivos"),
-        ("Tip", "texto"),
-        ("SeccionPractica", "enunciado"),
-        ("Ejercicio", "enunciado"),
-        ("Respuesta", "texto")
-    ]
-
-    for label, prop in target_nodes:
-        results = session.run(f"MATCH (n:{label}) RETURN n.{prop} AS text, id(n) AS id")
-        for record in results:
-            text = record["text"]
-            if text is not None:
-                node_id = record["id"]
-                cache_key = f"{label}:{prop}:{text}"
-                if cache_key not in cache:
-                    response = openai.embeddings.create(input=[text], model="text-embedding-ada-002")
-                    emb = response.data[0].embedding
-                    session.run(
-                        f"MATCH (n:{label}) WHERE id(n) = $id SET n.embedding_{prop} = $emb",
-                        {"id": node_id, "emb": emb}
-                    )
-                    session.run(
-                        "CREATE VECTOR INDEX idx_" + label + "_" + prop + " IF NOT EXISTS FOR (n:" + label + ") ON (n.embedding_" + prop + ") "
-                        "OPTIONS { indexConfig: {`vector.dimensions`: 1536,`vector.similarity_function`: 'cosine'}}"
-                    )
-                    cache[cache_key] = emb
-
-    # Guardar cache
-    with open(cache_path, "wb") as f:
-        pickle.dump(cache, f)
+    cache = _load_cache(cache_path)
+
+    # Un vector index por propiedad, creado antes de escribir los embeddings
+    for query in VECTOR_INDEX_QUERIES:
+        session.run(query)
+
+    # Los embeddings nuevos se agregan al archivo del cache lote por lote
+    with open(cache_path, "ab") as cache_file:
+        for read_query, write_query in EMBEDDING_QUERIES:
+            results = session.run(read_query)
+            nodes = [(record["id"], _text_key(record["text"]), record["text"]) for record in results]
+            if not nodes:
+                continue
+
+            # Solo se envían a OpenAI los textos que no están en cache, una vez cada uno
+            # (un mismo texto en distintos labels comparte embedding)
+            missing = {cache_key: text for _, cache_key, text in nodes if cache_key not in cache}
+            _embed_missing(missing, cache, cache_file)
+
+            # El grafo se recrea en cada carga, así que también se escriben los embeddings en cache.
+            # En memoria son float32 (array "f"); se pasan a lista recién al enviarlos por Bolt
+            session.execute_write(_write_rows, [(
+                write_query,
+                {"rows": [{"id": node_id, "emb": cache[cache_key].tolist()} for node_id, cache_key, _ in nodes]}
+            )])
+
+def _embed_missing(missing, cache, cache_file):
+    """
+    Obtener de OpenAI, en lotes, los embeddings de missing (clave -> texto).
+
+    Los embeddings se guardan como array("f"), en el mismo float32 que usa el
+    vector index, en lugar de listas de floats de Python.
+
+    Cada lote se agrega al cache en memoria y al archivo antes de pedir el
+    siguiente, así una carga interrumpida no pierde lo ya calculado.
+    """
+    pending = iter(missing.items())
+    while batch := list(islice(pending, EMBEDDING_BATCH_SIZE)):
+        keys, texts = zip(*batch)
+        response = openai.embeddings.create(input=list(texts), model=EMBEDDING_MODEL)
+        embeddings = [array("f", item.embedding) for item in sorted(response.data, key=lambda item: item.index)]
+        cache.update(zip(keys, embeddings))
+        cache_file.write(b"".join(_cache_record(key, emb) for key, emb in zip(keys, embeddings)))
+        cache_file.flush()
+
+def _text_key(text):
+    """Clave del cache de embeddings: hash del texto, independiente del label."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def _cache_record(key, emb):
+    """Serializar una entrada del cache de embeddings."""
+    return CACHE_RECORD_HEADER.pack(len(key), len(emb)) + key + emb.tobytes()
+
+def _load_cache(cache_path):
+    """
+    Leer el cache de embeddings.
+
+    Si el último registro quedó incompleto (carga interrumpida) se descarta y
+    se trunca el archivo. Si no existe el archivo pero sí un cache en el
+    formato anterior (.pkl, con claves "label:prop:texto"), se convierte.
+    """
+    cache = {}
+    if not os.path.exists(cache_path):
+        legacy_path = os.path.splitext(cache_path)[0] + ".pkl"
+        if os.path.exists(legacy_path):
+            with open(legacy_path, "rb") as f:
+                legacy = pickle.load(f)
+            cache = {_text_key(key.split(":", 2)[2]): array("f", emb) for key, emb in legacy.items()}
+            with open(cache_path, "wb") as f:
+                f.write(b"".join(_cache_record(key, emb) for key, emb in cache.items()))
+        return cache
+
+    with open(cache_path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset + CACHE_RECORD_HEADER.size <= len(data):
+        key_len, dims = CACHE_RECORD_HEADER.unpack_from(data, offset)
+        start = offset + CACHE_RECORD_HEADER.size
+        end = start + key_len + 4 * dims
+        if end > len(data):
+            break
+        key = data[start:start + key_len]
+        cache[key] = array("f", data[start + key_len:end])
+        offset = end
+    if offset < len(data):
+        os.truncate(cache_path, offset)
+    return cache
 
 # Ejemplo de uso
 if __name__ == "__main__":
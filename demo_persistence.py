@@ -13,14 +13,22 @@ from gapanalyzer.agent import GapAnalyzerAgent
 from gapanalyzer.schemas import StudentContext
 
 
+def _tagged_print(tag: str):
+    """Return a print function that prefixes every line with the demo tag."""
+    def say(*args, **kwargs):
+        print(f"[{tag}]", *args, **kwargs)
+    return say
+
+
 async def demo_orchestrator_persistence(student_id: str = None):
     """Demonstrate Orchestrator agent with Neo4j persistence."""
-    print("🎓 LUCA Orchestrator with Neo4j Persistence Demo")
-    print("=" * 50)
+    say = _tagged_print("orchestrator")
+    say("🎓 LUCA Orchestrator with Neo4j Persistence Demo")
+    say("=" * 50)
     
     # Create agent with Neo4j persistence enabled
     agent = OrchestratorAgent()
-    print(f"✓ Created Orchestrator with Neo4j persistence")
+    say(f"✓ Created Orchestrator with Neo4j persistence")
     
     # Create conversation context
     user_id = student_id or "visitante@uca.edu.ar"  # Use provided student or default visitor
@@ -42,15 +50,15 @@ async def demo_orchestrator_persistence(student_id: str = None):
         educational_subject="Bases de Datos Relacionales"
     )
     
-    print(f"✓ Created conversation context for user: {user_id}")
-    print(f"  Subject: {context.memory.educational_context.current_subject}")
-    print(f"  Question: {context.current_message}")
+    say(f"✓ Created conversation context for user: {user_id}")
+    say(f"  Subject: {context.memory.educational_context.current_subject}")
+    say(f"  Question: {context.current_message}")
     
     # Process message using stream method - this will store checkpoints and long-term memory
     try:
-        print("  Processing message through streaming interface...")
+        say("  Processing message through streaming interface...")
         message_count = 0
-        final_content = ""
+        content_parts = []
         
         async for chunk in agent.stream(
             query=context.current_message, 
@@ -60,34 +68,36 @@ async def demo_orchestrator_persistence(student_id: str = None):
         ):
             message_count += 1
             if chunk.get('type') == 'content':
-                final_content += chunk.get('content', '')
+                content_parts.append(chunk.get('content', ''))
+        final_content = "".join(content_parts)
         
-        print(f"✓ Message processed successfully")
-        print(f"  Processed {message_count} chunks")
-        print(f"  Response length: {len(final_content)} characters")
-        print(f"  Sample response: {final_content[:100]}..." if final_content else "  No content received")
+        say(f"✓ Message processed successfully")
+        say(f"  Processed {message_count} chunks")
+        say(f"  Response length: {len(final_content)} characters")
+        say(f"  Sample response: {final_content[:100]}..." if final_content else "  No content received")
         
         # The agent automatically stored:
         # - Conversation checkpoint in Neo4j (for resumability) 
         # - Long-term memory about topics discussed
         # - Learning patterns and intent history
-        print(f"✓ Persisted conversation state and learning patterns to Neo4j")
+        say(f"✓ Persisted conversation state and learning patterns to Neo4j")
         
     except Exception as e:
-        print(f"❌ Error processing message: {e}")
+        say(f"❌ Error processing message: {e}")
         # Let's still continue with the demo to show other functionality
     
-    print()
+    say()
 
 
 async def demo_gapanalyzer_persistence(student_id: str = None):
     """Demonstrate GapAnalyzer agent with Neo4j persistence."""
-    print("🔍 LUCA GapAnalyzer with Neo4j Persistence Demo")
-    print("=" * 50)
+    say = _tagged_print("gapanalyzer")
+    say("🔍 LUCA GapAnalyzer with Neo4j Persistence Demo")
+    say("=" * 50)
     
     # Create agent with Neo4j persistence enabled
     agent = GapAnalyzerAgent()
-    print(f"✓ Created GapAnalyzer with Neo4j persistence")
+    say(f"✓ Created GapAnalyzer with Neo4j persistence")
     
     # Create student context for gap analysis
     user_id = student_id or "visitante@uca.edu.ar"  # Use provided student or default visitor
@@ -105,42 +115,43 @@ async def demo_gapanalyzer_persistence(student_id: str = None):
         tips_context="Recordar que LEFT JOIN incluye todos los registros de la tabla izquierda, incluso si no hay coincidencias en la tabla derecha."
     )
     
-    print(f"✓ Created student context for user: {user_id}")
-    print(f"  Subject: {context.subject_name}")
-    print(f"  Question: {context.student_question}")
-    print(f"  Practice context: {context.practice_context[:50]}...")
+    say(f"✓ Created student context for user: {user_id}")
+    say(f"  Subject: {context.subject_name}")
+    say(f"  Question: {context.student_question}")
+    say(f"  Practice context: {context.practice_context[:50]}...")
     
     # Analyze gaps using stream method - this will store gap analysis results and patterns
     try:
-        print("  Processing gap analysis through streaming interface...")
+        say("  Processing gap analysis through streaming interface...")
         gap_session_id = f"gap_session_{uuid4()}"
         chunk_count = 0
-        analysis_content = ""
+        analysis_parts = []
         
         async for chunk in agent.stream(query=context, context_id=gap_session_id):
             chunk_count += 1
             if chunk.get('type') == 'content':
-                analysis_content += chunk.get('content', '')
+                analysis_parts.append(chunk.get('content', ''))
             elif chunk.get('type') == 'analysis_result':
                 # This would contain the structured analysis results
                 pass
+        analysis_content = "".join(analysis_parts)
         
-        print(f"✓ Gap analysis completed successfully")
-        print(f"  Processed {chunk_count} analysis chunks")
-        print(f"  Analysis content length: {len(analysis_content)} characters")
-        print(f"  Sample analysis: {analysis_content[:100]}..." if analysis_content else "  No analysis content received")
+        say(f"✓ Gap analysis completed successfully")
+        say(f"  Processed {chunk_count} analysis chunks")
+        say(f"  Analysis content length: {len(analysis_content)} characters")
+        say(f"  Sample analysis: {analysis_content[:100]}..." if analysis_content else "  No analysis content received")
         
         # The agent automatically stored:
         # - Gap analysis checkpoint in Neo4j
         # - Learning gaps and patterns 
         # - Recommendation effectiveness tracking
-        print(f"✓ Persisted gap analysis results and learning patterns to Neo4j")
+        say(f"✓ Persisted gap analysis results and learning patterns to Neo4j")
         
     except Exception as e:
-        print(f"❌ Error analyzing gaps: {e}")
+        say(f"❌ Error analyzing gaps: {e}")
         # Continue with demo to show other functionality
     
-    print()
+    say()
 
 
 async def demo_memory_continuity():
@@ -215,8 +226,11 @@ async def main(student_id: str = None):
     print(f"Using student: {demo_student}\n")
     
     try:
-        await demo_orchestrator_persistence(demo_student)
-        await demo_gapanalyzer_persistence(demo_student)
+        # Both agents are independent, so their demos run concurrently
+        await asyncio.gather(
+            demo_orchestrator_persistence(demo_student),
+            demo_gapanalyzer_persistence(demo_student)
+        )
         await demo_memory_continuity()
         print_persistence_benefits()
         
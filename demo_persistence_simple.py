@@ -2,22 +2,77 @@
 Simple demonstration of Neo4j persistence functionality.
 
 This script demonstrates that the Neo4j persistence is working correctly
-without relying on complex agent APIs.
+without relying on complex agent APIs. Run it with --inmemory to go through
+the same steps with minimal in-memory stand-ins, without a Neo4j database.
 """
 
 import asyncio
 from uuid import uuid4
-from kg.persistence import create_neo4j_persistence
+from langgraph.checkpoint.base import CheckpointTuple
+from kg.persistence import create_neo4j_persistence, serialize_for_neo4j
 
 
-async def demo_basic_persistence():
+class DemoCheckpointer:
+    """In-memory stand-in for the checkpoint calls used by this demo."""
+    
+    def __init__(self):
+        self._checkpoints = {}
+    
+    async def aput(self, config, checkpoint, metadata, new_versions=None):
+        thread_id = config["configurable"]["thread_id"]
+        self._checkpoints[(thread_id, checkpoint["id"])] = (checkpoint, metadata)
+        return config
+    
+    async def aget_tuple(self, config):
+        key = (config["configurable"]["thread_id"], config["configurable"].get("checkpoint_id"))
+        if key not in self._checkpoints:
+            return None
+        checkpoint, metadata = self._checkpoints[key]
+        return CheckpointTuple(config=config, checkpoint=checkpoint, metadata=metadata)
+
+
+class DemoMemoryStore:
+    """In-memory stand-in for the memory store calls used by this demo."""
+    
+    def __init__(self):
+        self._memories = {}
+    
+    async def aput(self, namespace, key, value):
+        memories = self._memories.setdefault(namespace, {})
+        # Re-inserting keeps the most recently updated memory last
+        memories.pop(key, None)
+        memories[key] = value
+    
+    async def aget_many(self, namespace, keys):
+        memories = self._memories.get(namespace, {})
+        return {key: memories[key] for key in keys if key in memories}
+    
+    async def alist(self, namespace):
+        return list(reversed(self._memories.get(namespace, {})))
+    
+    async def asearch(self, namespace, query, limit=10):
+        # Same case-insensitive match over the serialized value as the Neo4j store
+        query = query.lower()
+        memories = self._memories.get(namespace, {})
+        matches = [
+            (key, memories[key]) for key in reversed(memories)
+            if query in serialize_for_neo4j(memories[key]).lower()
+        ]
+        return matches[:limit]
+
+
+async def demo_basic_persistence(inmemory: bool = False):
     """Demonstrate basic Neo4j persistence functionality."""
     print("🎯 LUCA Neo4j Persistence Demonstration")
     print("=" * 45)
     
     # Create persistence components
-    checkpointer, memory_store = create_neo4j_persistence()
-    print("✓ Created Neo4j persistence components")
+    if inmemory:
+        checkpointer, memory_store = DemoCheckpointer(), DemoMemoryStore()
+        print("✓ Created in-memory persistence components")
+    else:
+        checkpointer, memory_store = create_neo4j_persistence()
+        print("✓ Created Neo4j persistence components")
     
     # Simulate agent conversation checkpointing
     print("\n📝 Checkpoint Persistence Demo:")
@@ -53,11 +108,11 @@ async def demo_basic_persistence():
     }
     
     # Store checkpoint
-    checkpointer.put(config, checkpoint, metadata)
+    await checkpointer.aput(config, checkpoint, metadata)
     print(f"  ✓ Stored conversation checkpoint: {config['configurable']['checkpoint_id'][:12]}...")
     
     # Retrieve checkpoint
-    retrieved = checkpointer.get_tuple(config)
+    retrieved = await checkpointer.aget_tuple(config)
     if retrieved:
         conversation_data = retrieved.checkpoint["channel_values"]["conversation_state"]
         print(f"  ✓ Retrieved checkpoint - Subject: {conversation_data['subject']}")
@@ -85,7 +140,7 @@ async def demo_basic_persistence():
         }
     }
     
-    memory_store.put(namespace, f"interaction_{thread_id}", learning_memory)
+    await memory_store.aput(namespace, f"interaction_{thread_id}", learning_memory)
     print(f"  ✓ Stored learning interaction for user: {user_id[:12]}...")
     
     # Store learning patterns
@@ -102,21 +157,22 @@ async def demo_basic_persistence():
         "updated_at": "2025-01-27T15:30:00"
     }
     
-    memory_store.put(namespace, "learning_patterns", pattern_memory)
+    await memory_store.aput(namespace, "learning_patterns", pattern_memory)
     print(f"  ✓ Stored learning patterns analysis")
     
     # Demonstrate memory retrieval and search
     print("\n🔍 Memory Retrieval Demo:")
     
-    # Get specific memory
-    retrieved_interaction = memory_store.get(namespace, f"interaction_{thread_id}")
+    # Get specific memories (the learning patterns are used later for personalization)
+    retrieved = await memory_store.aget_many(namespace, [f"interaction_{thread_id}", "learning_patterns"])
+    retrieved_interaction = retrieved.get(f"interaction_{thread_id}")
     if retrieved_interaction:
         print(f"  ✓ Retrieved interaction - Topic: {retrieved_interaction['topic']}")
         print(f"    Confidence: {retrieved_interaction['confidence_score']}")
         print(f"    Concepts: {', '.join(retrieved_interaction['concepts_covered'])}")
     
     # Search for topic-related memories
-    search_results = memory_store.search(namespace, "normalización", limit=5)
+    search_results = await memory_store.asearch(namespace, "normalización", limit=5)
     print(f"  ✓ Found {len(search_results)} memories related to 'normalización'")
     
     for key, memory in search_results:
@@ -124,7 +180,7 @@ async def demo_basic_persistence():
         print(f"    - {key[:20]}... ({memory_type})")
     
     # List all memories for user
-    all_memories = memory_store.list(namespace)
+    all_memories = await memory_store.alist(namespace)
     print(f"  ✓ Total memories stored for user: {len(all_memories)}")
     
     # Demonstrate gap analysis memory storage
@@ -162,7 +218,7 @@ async def demo_basic_persistence():
         "timestamp": "2025-01-27T15:30:00"
     }
     
-    memory_store.put(gap_namespace, f"analysis_{thread_id}", gap_memory)
+    await memory_store.aput(gap_namespace, f"analysis_{thread_id}", gap_memory)
     print(f"  ✓ Stored gap analysis results")
     print(f"    Identified {len(gap_memory['identified_gaps'])} learning gaps")
     print(f"    Analysis confidence: {gap_memory['analysis_confidence']}")
@@ -174,7 +230,7 @@ async def demo_basic_persistence():
     new_thread_id = f"session_2_{uuid4()}"
     
     # Retrieve existing learning patterns to inform new conversation
-    existing_patterns = memory_store.get(namespace, "learning_patterns")
+    existing_patterns = retrieved.get("learning_patterns")
     if existing_patterns:
         print(f"  ✓ Retrieved existing learning patterns for personalization")
         print(f"    Frequent topics: {', '.join(existing_patterns['frequent_topics'][:3])}")
@@ -182,7 +238,7 @@ async def demo_basic_persistence():
         print(f"    Topic mastery: {existing_patterns['success_indicators']['topic_mastery_progress']:.1%}")
     
     # Search for related previous interactions
-    related_memories = memory_store.search(namespace, "SQL", limit=3)
+    related_memories = await memory_store.asearch(namespace, "SQL", limit=3)
     print(f"  ✓ Found {len(related_memories)} SQL-related memories from previous sessions")
     
     print("\n✨ Benefits Demonstrated:")
@@ -201,4 +257,5 @@ async def demo_basic_persistence():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo_basic_persistence())
\ No newline at end of file
+    import sys
+    asyncio.run(demo_basic_persistence(inmemory="--inmemory" in sys.argv[1:]))
\ No newline at end of file
@@ -673,7 +673,6 @@ Evalúa cada gap según los criterios pedagógicos.""")
             practice_num = getattr(state.student_context, 'practice_number', 'unknown')
             exercise_sec = getattr(state.student_context, 'exercise_section', 'unknown')
             analysis_key = f"gaps_{practice_num}_{exercise_sec}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            self.memory_store.put(namespace, analysis_key, gaps_memory)
             
             # Store learning patterns
             patterns_memory = {
@@ -692,7 +691,7 @@ Evalúa cada gap según los criterios pedagógicos.""")
             }
             
             # Check if we have existing patterns and merge
-            existing_patterns = self.memory_store.get(namespace, "learning_patterns_summary")
+            existing_patterns = await self.memory_store.aget(namespace, "learning_patterns_summary")
             if existing_patterns:
                 # Merge gap categories
                 existing_patterns["common_gap_categories"].extend(patterns_memory["common_gap_categories"])
@@ -701,7 +700,11 @@ Evalúa cada gap según los criterios pedagógicos.""")
                 existing_patterns["updated_at"] = datetime.now().isoformat()
                 patterns_memory = existing_patterns
             
-            self.memory_store.put(namespace, "learning_patterns_summary", patterns_memory)
+            # Both memories are written together in a single round-trip
+            await self.memory_store.aput_many(namespace, {
+                analysis_key: gaps_memory,
+                "learning_patterns_summary": patterns_memory
+            })
             
             # Note: Recommendations tracking removed as recommendations field was removed from GapAnalysisResult
             
@@ -21,12 +21,16 @@ class KGConnection:
     
     Handles Neo4j driver creation and session management using environment variables.
     Uses NEO4J_URI, NEO4J_USERNAME, and NEO4J_PASSWORD from .envrc or environment.
+    The connection pool can be tuned with NEO4J_MAX_CONNECTION_POOL_SIZE and
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT; the driver defaults apply when unset.
     """
     
     def __init__(self, 
                  uri: Optional[str] = None,
                  user: Optional[str] = None, 
-                 password: Optional[str] = None):
+                 password: Optional[str] = None,
+                 max_connection_pool_size: Optional[int] = None,
+                 connection_acquisition_timeout: Optional[float] = None):
         """
         Initialize KG connection with Neo4j credentials.
         
@@ -34,11 +38,25 @@ class KGConnection:
             uri: Neo4j URI (defaults to NEO4J_URI env var)
             user: Neo4j username (defaults to NEO4J_USERNAME env var)
             password: Neo4j password (defaults to NEO4J_PASSWORD env var)
+            max_connection_pool_size: Maximum pooled connections
+                (defaults to NEO4J_MAX_CONNECTION_POOL_SIZE env var)
+            connection_acquisition_timeout: Seconds to wait for a pooled connection
+                (defaults to NEO4J_CONNECTION_ACQUISITION_TIMEOUT env var)
         """
         self.uri = uri or os.getenv('NEO4J_URI')
         self.user = user or os.getenv('NEO4J_USERNAME')
         self.password = password or os.getenv('NEO4J_PASSWORD')
         
+        pool_size = max_connection_pool_size or os.getenv('NEO4J_MAX_CONNECTION_POOL_SIZE')
+        acquisition_timeout = connection_acquisition_timeout or os.getenv('NEO4J_CONNECTION_ACQUISITION_TIMEOUT')
+        
+        # Only explicitly configured pool settings are passed to the driver
+        self.driver_config = {}
+        if pool_size:
+            self.driver_config['max_connection_pool_size'] = int(pool_size)
+        if acquisition_timeout:
+            self.driver_config['connection_acquisition_timeout'] = float(acquisition_timeout)
+        
         if not all([self.uri, self.user, self.password]):
             missing = [var for var, val in [
                 ('NEO4J_URI', self.uri),
@@ -58,11 +76,12 @@ class KGConnection:
             try:
                 self._driver = GraphDatabase.driver(
                     self.uri, 
-                    auth=(self.user, self.password)
+                    auth=(self.user, self.password),
+                    **self.driver_config
                 )
                 # Test connection
                 self._driver.verify_connectivity()
-                logger.info(f"Connected to Neo4j at {self.uri}")
+                logger.info(f"Connected to Neo4j at {self.uri} (pool config: {self.driver_config or 'driver defaults'})")
             except ServiceUnavailable as e:
                 raise KGConnectionError(f"Failed to connect to Neo4j: {e}") from e
             except AuthError as e:
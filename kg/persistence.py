@@ -3,8 +3,14 @@ Neo4j-based persistence implementations for LangGraph memory and checkpoints.
 
 This module provides Neo4j implementations for both checkpointers (short-term memory)
 and memory stores (long-term memory) to enable persistent agent memory across sessions.
+
+The async methods run the synchronous driver calls in a worker thread
+(asyncio.to_thread), so agents awaiting them do not block the event loop.
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import logging
 from datetime import datetime
@@ -142,6 +148,26 @@ def deserialize_from_neo4j(json_str: str) -> Any:
         return json_str  # Return original string if deserialization fails
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_connection(
+    max_connection_pool_size: Optional[int] = None,
+    connection_acquisition_timeout: Optional[float] = None,
+) -> KGConnection:
+    """
+    Return the process-wide KGConnection used when no connection is given.
+    
+    Every persistence component created without an explicit connection shares
+    this one, so its driver and connection pool are built only once. The
+    driver is closed at interpreter exit.
+    """
+    kg = KGConnection(
+        max_connection_pool_size=max_connection_pool_size,
+        connection_acquisition_timeout=connection_acquisition_timeout
+    )
+    atexit.register(kg.close)
+    return kg
+
+
 class Neo4jCheckpointSaver(BaseCheckpointSaver):
     """
     Neo4j-based checkpoint saver for LangGraph agents.
@@ -153,7 +179,7 @@ class Neo4jCheckpointSaver(BaseCheckpointSaver):
     def __init__(self, kg_connection: Optional[KGConnection] = None):
         """Initialize with Neo4j connection."""
         super().__init__()
-        self.kg = kg_connection or KGConnection()
+        self.kg = kg_connection or _shared_connection()
         self._ensure_checkpoint_schema()
     
     def _ensure_checkpoint_schema(self):
@@ -206,14 +232,13 @@ class Neo4jCheckpointSaver(BaseCheckpointSaver):
                         c.versions = $versions,
                         c.timestamp = datetime(),
                         c.updated_at = datetime()
-                    RETURN c
                 """, {
                     "thread_id": thread_id,
                     "checkpoint_id": checkpoint_id,
                     "checkpoint_data": checkpoint_data,
                     "metadata": metadata_data,
                     "versions": versions_data
-                })
+                }).consume()
                 
                 logger.debug(f"Stored checkpoint {checkpoint_id} for thread {thread_id}")
                 
@@ -231,7 +256,7 @@ class Neo4jCheckpointSaver(BaseCheckpointSaver):
         new_versions: Optional[Dict[str, Any]] = None,
     ) -> RunnableConfig:
         """Async version of put method."""
-        return self.put(config, checkpoint, metadata, new_versions)
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
     
     def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Retrieve a specific checkpoint from Neo4j."""
@@ -283,7 +308,7 @@ class Neo4jCheckpointSaver(BaseCheckpointSaver):
     
     async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
         """Async version of get_tuple method."""
-        return self.get_tuple(config)
+        return await asyncio.to_thread(self.get_tuple, config)
     
     def list(
         self,
@@ -343,7 +368,10 @@ class Neo4jCheckpointSaver(BaseCheckpointSaver):
         limit: Optional[int] = None,
     ) -> Iterator[CheckpointTuple]:
         """Async version of list method."""
-        for item in self.list(config, filter=filter, before=before, limit=limit):
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
             yield item
     
     async def aput_writes(
@@ -368,7 +396,7 @@ class Neo4jMemoryStore(BaseStore):
     
     def __init__(self, kg_connection: Optional[KGConnection] = None):
         """Initialize with Neo4j connection."""
-        self.kg = kg_connection or KGConnection()
+        self.kg = kg_connection or _shared_connection()
         self._ensure_memory_schema()
     
     def _ensure_memory_schema(self):
@@ -410,34 +438,67 @@ class Neo4jMemoryStore(BaseStore):
         value: Dict[str, Any],
     ) -> None:
         """Store a memory in Neo4j."""
+        self.put_many(namespace, {key: value})
+    
+    def put_many(
+        self,
+        namespace: Tuple[str, ...],
+        items: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Store several memories of a namespace in Neo4j.
+        
+        All items are written by a single UNWIND statement, so they share one
+        round-trip and one transaction instead of one per memory.
+        
+        Args:
+            namespace: Namespace of the memories
+            items: Mapping of memory key to memory value
+        """
+        if not items:
+            return
+        
         namespace_str = "/".join(namespace)
-        value_json = serialize_for_neo4j(value)
+        rows = [
+            {
+                "key": key,
+                "value": serialize_for_neo4j(value),
+                "memory_type": value.get("type", "general")
+            }
+            for key, value in items.items()
+        ]
         
         with self.kg.driver.session() as session:
             try:
                 session.run("""
-                    MERGE (m:AgentMemory {namespace: $namespace, key: $key})
-                    SET m.value = $value,
+                    UNWIND $rows AS row
+                    MERGE (m:AgentMemory {namespace: $namespace, key: row.key})
+                    SET m.value = row.value,
                         m.created_at = CASE 
                             WHEN m.created_at IS NULL THEN datetime() 
                             ELSE m.created_at 
                         END,
                         m.updated_at = datetime(),
-                        m.type = $memory_type
-                    RETURN m
+                        m.type = row.memory_type
                 """, {
                     "namespace": namespace_str,
-                    "key": key,
-                    "value": value_json,
-                    "memory_type": value.get("type", "general")
-                })
+                    "rows": rows
+                }).consume()
                 
-                logger.debug(f"Stored memory {key} in namespace {namespace_str}")
+                logger.debug(f"Stored {len(rows)} memories in namespace {namespace_str}")
                 
             except Neo4jError as e:
                 logger.error(f"Failed to store memory: {e}")
                 raise
     
+    async def aput_many(
+        self,
+        namespace: Tuple[str, ...],
+        items: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Async version of put_many method."""
+        await asyncio.to_thread(self.put_many, namespace, items)
+    
     async def aput(
         self,
         namespace: Tuple[str, ...],
@@ -445,7 +506,7 @@ class Neo4jMemoryStore(BaseStore):
         value: Dict[str, Any],
     ) -> None:
         """Async version of put method."""
-        self.put(namespace, key, value)
+        await asyncio.to_thread(self.put, namespace, key, value)
     
     def get(
         self,
@@ -478,7 +539,52 @@ class Neo4jMemoryStore(BaseStore):
         key: str,
     ) -> Optional[Dict[str, Any]]:
         """Async version of get method."""
-        return self.get(namespace, key)
+        return await asyncio.to_thread(self.get, namespace, key)
+    
+    def get_many(
+        self,
+        namespace: Tuple[str, ...],
+        keys: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve several memories of a namespace in a single query.
+        
+        Args:
+            namespace: Namespace of the memories
+            keys: Memory keys to retrieve
+            
+        Returns:
+            Mapping of key to memory value; keys that don't exist are omitted
+        """
+        if not keys:
+            return {}
+        
+        namespace_str = "/".join(namespace)
+        
+        with self.kg.driver.session() as session:
+            try:
+                result = session.run("""
+                    UNWIND $keys AS key
+                    MATCH (m:AgentMemory {namespace: $namespace, key: key})
+                    RETURN m.key as key, m.value as value
+                """, {"namespace": namespace_str, "keys": list(keys)})
+                
+                return {
+                    record["key"]: deserialize_from_neo4j(record["value"])
+                    for record in result
+                }
+                
+            except (Neo4jError, json.JSONDecodeError) as e:
+                logger.error(f"Failed to retrieve memories: {e}")
+                return {}
+    
+    async def aget_many(
+        self,
+        namespace: Tuple[str, ...],
+        keys: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async version of get_many method."""
+        return await asyncio.to_thread(self.get_many, namespace, keys)
     
     def delete(
         self,
@@ -505,6 +611,14 @@ class Neo4jMemoryStore(BaseStore):
                 logger.error(f"Failed to delete memory: {e}")
                 raise
     
+    async def adelete(
+        self,
+        namespace: Tuple[str, ...],
+        key: str,
+    ) -> None:
+        """Async version of delete method."""
+        await asyncio.to_thread(self.delete, namespace, key)
+    
     def list(
         self,
         namespace: Tuple[str, ...],
@@ -526,6 +640,13 @@ class Neo4jMemoryStore(BaseStore):
                 logger.error(f"Failed to list memories: {e}")
                 return []
     
+    async def alist(
+        self,
+        namespace: Tuple[str, ...],
+    ) -> List[str]:
+        """Async version of list method."""
+        return await asyncio.to_thread(self.list, namespace)
+    
     def search(
         self,
         namespace: Tuple[str, ...],
@@ -574,6 +695,16 @@ class Neo4jMemoryStore(BaseStore):
                 logger.error(f"Failed to search memories: {e}")
                 return []
     
+    async def asearch(
+        self,
+        namespace: Tuple[str, ...],
+        query: str,
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Async version of search method."""
+        return await asyncio.to_thread(self.search, namespace, query, limit, filter)
+    
     async def abatch(
         self,
         operations: Sequence[tuple],
@@ -589,14 +720,23 @@ class Neo4jMemoryStore(BaseStore):
         raise NotImplementedError("Batch operations not implemented for Neo4j store")
 
 
-def create_neo4j_persistence(kg_connection: Optional[KGConnection] = None) -> Tuple[Neo4jCheckpointSaver, Neo4jMemoryStore]:
+def create_neo4j_persistence(
+    kg_connection: Optional[KGConnection] = None,
+    max_connection_pool_size: Optional[int] = None,
+    connection_acquisition_timeout: Optional[float] = None,
+) -> Tuple[Neo4jCheckpointSaver, Neo4jMemoryStore]:
     """
     Create Neo4j-based persistence components for LangGraph agents.
     
+    Args:
+        kg_connection: Connection to use (defaults to the process-wide shared connection)
+        max_connection_pool_size: Pool size of the shared connection
+        connection_acquisition_timeout: Pool acquisition timeout, in seconds, of the shared connection
+    
     Returns:
         Tuple of (checkpointer, memory_store) for agent configuration
     """
-    kg = kg_connection or KGConnection()
+    kg = kg_connection or _shared_connection(max_connection_pool_size, connection_acquisition_timeout)
     checkpointer = Neo4jCheckpointSaver(kg)
     memory_store = Neo4jMemoryStore(kg)
     
@@ -827,7 +827,8 @@ Crea una respuesta pedagógica que guíe al estudiante a destrabar su situación
                 "updated_at": datetime.now().isoformat(),
                 "session_id": ctx.session_id
             }
-            self.memory_store.put(namespace, "topics_discussed", topics_memory)
+            # All memories of this turn are written together at the end
+            memories = {"topics_discussed": topics_memory}
             
             # Store practice progress
             if ctx.memory.educational_context.current_practice:
@@ -838,7 +839,7 @@ Crea una respuesta pedagógica que guíe al estudiante a destrabar su situación
                     "updated_at": datetime.now().isoformat(),
                     "session_id": ctx.session_id
                 }
-                self.memory_store.put(namespace, "practice_progress", practice_memory)
+                memories["practice_progress"] = practice_memory
             
             # Store learning patterns based on intent patterns
             intent_memory = {
@@ -850,7 +851,7 @@ Crea una respuesta pedagógica que guíe al estudiante a destrabar su situación
             }
             
             # Check if we have existing learning patterns and merge
-            existing_patterns = self.memory_store.get(namespace, "learning_patterns")
+            existing_patterns = await self.memory_store.aget(namespace, "learning_patterns")
             if existing_patterns:
                 existing_patterns["recent_intents"].append(state.intent_result.predicted_intent.value)
                 existing_patterns["confidence_scores"].append(state.intent_result.confidence)
@@ -860,7 +861,8 @@ Crea una respuesta pedagógica que guíe al estudiante a destrabar su situación
                 existing_patterns["updated_at"] = datetime.now().isoformat()
                 intent_memory = existing_patterns
             
-            self.memory_store.put(namespace, "learning_patterns", intent_memory)
+            memories["learning_patterns"] = intent_memory
+            await self.memory_store.aput_many(namespace, memories)
             
             logger.debug(f"Stored long-term memory for user {user_id}")
             
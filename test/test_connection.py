@@ -66,6 +66,43 @@ class TestKGConnectionInitialization:
                 KGConnection()
             
             assert "NEO4J_PASSWORD" in str(excinfo.value)
+    
+    def test_init_pool_config_defaults_to_driver(self):
+        """Test that no pool settings are forced when none are configured."""
+        with patch.dict(os.environ, {}, clear=True):
+            conn = KGConnection(uri="bolt://test:7687", user="test_user", password="test_password")
+            
+            assert conn.driver_config == {}
+    
+    def test_init_pool_config_from_env_vars(self):
+        """Test that pool settings are read from environment variables."""
+        with patch.dict(os.environ, {
+            'NEO4J_MAX_CONNECTION_POOL_SIZE': '100',
+            'NEO4J_CONNECTION_ACQUISITION_TIMEOUT': '30'
+        }, clear=True):
+            conn = KGConnection(uri="bolt://test:7687", user="test_user", password="test_password")
+            
+            assert conn.driver_config == {
+                'max_connection_pool_size': 100,
+                'connection_acquisition_timeout': 30.0
+            }
+    
+    def test_pool_config_passed_to_driver(self):
+        """Test that explicit pool settings reach GraphDatabase.driver."""
+        conn = KGConnection(
+            uri="bolt://test:7687", user="test_user", password="test_password",
+            max_connection_pool_size=20, connection_acquisition_timeout=5.0
+        )
+        
+        with patch('kg.connection.GraphDatabase.driver') as mock_driver:
+            conn.driver
+            
+            mock_driver.assert_called_once_with(
+                "bolt://test:7687",
+                auth=("test_user", "test_password"),
+                max_connection_pool_size=20,
+                connection_acquisition_timeout=5.0
+            )
 
 
 class TestKGConnectionFunctionality:
@@ -5,13 +5,15 @@ This module tests the Neo4j-based checkpointer and memory store implementations
 for LangGraph agent persistence functionality.
 """
 
+import os
 import pytest
 import json
 from datetime import datetime
 from typing import Dict, Any
+from unittest.mock import patch
 from uuid import uuid4
 
-from kg.persistence import Neo4jCheckpointSaver, Neo4jMemoryStore, create_neo4j_persistence
+from kg.persistence import Neo4jCheckpointSaver, Neo4jMemoryStore, create_neo4j_persistence, _shared_connection
 from kg.connection import KGConnection
 from langchain_core.runnables import RunnableConfig
 
@@ -170,6 +172,34 @@ class TestNeo4jMemoryStore:
         assert retrieved_memory["content"] == sample_memory["content"]
         assert retrieved_memory["metadata"]["importance"] == sample_memory["metadata"]["importance"]
     
+    @pytest.mark.integration
+    def test_put_many_memories(self, memory_store, test_namespace, sample_memory):
+        """Test storing several memories at once."""
+        items = {
+            f"test_memory_{i}_{uuid4()}": {**sample_memory, "index": i}
+            for i in range(3)
+        }
+        
+        memory_store.put_many(test_namespace, items)
+        
+        for key, value in items.items():
+            retrieved_memory = memory_store.get(test_namespace, key)
+            assert retrieved_memory is not None
+            assert retrieved_memory["index"] == value["index"]
+    
+    @pytest.mark.integration
+    def test_get_many_memories(self, memory_store, test_namespace, sample_memory):
+        """Test retrieving several memories at once."""
+        keys = [f"test_memory_{i}_{uuid4()}" for i in range(2)]
+        for i, key in enumerate(keys):
+            memory_store.put(test_namespace, key, {**sample_memory, "index": i})
+        
+        nonexistent_key = f"nonexistent_{uuid4()}"
+        memories = memory_store.get_many(test_namespace, keys + [nonexistent_key])
+        
+        assert set(memories) == set(keys)
+        assert memories[keys[1]]["index"] == 1
+    
     @pytest.mark.integration
     def test_get_nonexistent_memory(self, memory_store, test_namespace):
         """Test retrieving a memory that doesn't exist."""
@@ -276,6 +306,27 @@ class TestPersistenceFactory:
         assert isinstance(memory_store, Neo4jMemoryStore)
         assert checkpointer.kg == kg_connection
         assert memory_store.kg == kg_connection
+    
+    def test_create_neo4j_persistence_shares_connection(self):
+        """Test that components created without a connection share one driver."""
+        env = {
+            'NEO4J_URI': 'bolt://test:7687',
+            'NEO4J_USERNAME': 'test_user',
+            'NEO4J_PASSWORD': 'test_password'
+        }
+        _shared_connection.cache_clear()
+        try:
+            with patch.dict(os.environ, env), \
+                 patch.object(Neo4jCheckpointSaver, '_ensure_checkpoint_schema'), \
+                 patch.object(Neo4jMemoryStore, '_ensure_memory_schema'):
+                checkpointer, memory_store = create_neo4j_persistence()
+                other_checkpointer, other_memory_store = create_neo4j_persistence()
+                
+                assert checkpointer.kg is memory_store.kg
+                assert other_checkpointer.kg is checkpointer.kg
+                assert other_memory_store.kg is checkpointer.kg
+        finally:
+            _shared_connection.cache_clear()
 
 
 class TestPersistenceIntegration: